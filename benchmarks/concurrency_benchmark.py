@@ -0,0 +1,99 @@
+"""
+Concurrency benchmark of functions decorated with parameters validation.
+
+Measures the throughput of validated calls (fully validated, sampled and trusted)
+from 1 up to 64 threads and from concurrent asyncio tasks, next to the throughput
+of the bare function. On free-threaded CPython builds, throughput should grow with
+the number of threads; on builds with the GIL it should stay flat.
+
+Usage: python benchmarks/concurrency_benchmark.py [calls per thread]
+"""
+import asyncio
+import sys
+import threading
+import time
+
+from parameters_validation import validate_parameters, non_blank, non_negative, non_null, \
+    strongly_typed, trusted
+
+THREADS = (1, 2, 4, 8, 16, 32, 64)
+TASKS = 64
+
+
+def bare(name, age, tags=None):
+    return name, age, tags
+
+
+@validate_parameters
+def validated(name: non_blank(str), age: non_negative(int), tags: strongly_typed(list) | ~non_null() = None):
+    return name, age, tags
+
+
+@validate_parameters(sample_rate=0.01)
+def sampled(name: non_blank(str), age: non_negative(int), tags: strongly_typed(list) | ~non_null() = None):
+    return name, age, tags
+
+
+def trusted_validated(name, age, tags=None):
+    with trusted():
+        return validated(name, age, tags)
+
+
+FUNCTIONS = {
+    "bare": bare,
+    "validated": validated,
+    "sampled": sampled,
+    "trusted": trusted_validated,
+}
+
+
+def run_threads(function, threads: int, calls: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def work():
+        barrier.wait()
+        for _ in range(calls):
+            function("name", 42, tags=[])
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * calls / (time.perf_counter() - start)
+
+
+async def run_tasks(function, tasks: int, calls: int) -> float:
+    async def work():
+        for index in range(calls):
+            function("name", 42, tags=[])
+            if index % 100 == 0:
+                await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(work() for _ in range(tasks)))
+    return tasks * calls / (time.perf_counter() - start)
+
+
+def main(calls: int):
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("python {version} ({gil})".format(
+        version=sys.version.split()[0], gil="GIL enabled" if gil_enabled else "free-threaded"))
+    print("{:>10} {:>8} {:>16} {:>10}".format("function", "threads", "calls/s", "scaling"))
+    for name, function in FUNCTIONS.items():
+        single_thread = None
+        for threads in THREADS:
+            throughput = run_threads(function, threads, calls)
+            single_thread = single_thread or throughput
+            print("{:>10} {:>8} {:>16,.0f} {:>9.2f}x".format(name, threads, throughput, throughput / single_thread))
+    print()
+    print("{:>10} {:>8} {:>16}".format("function", "tasks", "calls/s"))
+    for name, function in FUNCTIONS.items():
+        throughput = asyncio.run(run_tasks(function, TASKS, calls))
+        print("{:>10} {:>8} {:>16,.0f}".format(name, TASKS, throughput))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
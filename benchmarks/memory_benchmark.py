@@ -0,0 +1,74 @@
+"""
+Memory benchmark of parameters validation across many decorated functions.
+
+Defines and decorates N functions annotated with the same handful of validations
+and reports the memory allocated with validation interning enabled (the default)
+and disabled.
+
+Usage: python benchmarks/memory_benchmark.py [N]
+"""
+import gc
+import sys
+import tracemalloc
+
+from parameters_validation import validate_parameters, non_blank, non_null, \
+    no_whitespaces, non_empty, non_negative, strongly_typed
+from parameters_validation import parameter_validation_decorator
+
+SOURCE = """
+def function_{index}(
+    a: non_null(str),
+    b: non_blank(str),
+    c: no_whitespaces(non_empty(str)),
+    d: non_negative(int),
+    e: strongly_typed(dict) = None,
+):
+    return a
+"""
+
+
+def decorate_functions(count: int) -> list:
+    namespace = {
+        "non_null": non_null,
+        "non_blank": non_blank,
+        "no_whitespaces": no_whitespaces,
+        "non_empty": non_empty,
+        "non_negative": non_negative,
+        "strongly_typed": lambda arg_type: strongly_typed(arg_type) | ~non_null(),
+    }
+    sources = [compile(SOURCE.format(index=index), "<benchmark>", "exec") for index in range(count)]
+    decorated = []
+    gc.collect()
+    tracemalloc.start()
+    for index, source in enumerate(sources):
+        exec(source, namespace)
+        function = namespace.pop("function_{index}".format(index=index))
+        decorated.append(validate_parameters(function))
+    gc.collect()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return decorated, allocated
+
+
+def main(count: int):
+    _, interned = decorate_functions(count)
+    interned_class = parameter_validation_decorator.ParameterValidation
+    interning = interned_class.__new__
+
+    def not_interned(cls, expression, arg_type):
+        return cls._build(expression, arg_type)
+
+    interned_class.__new__ = not_interned
+    try:
+        _, not_interned_allocated = decorate_functions(count)
+    finally:
+        interned_class.__new__ = interning
+    print("decorated functions:      {count}".format(count=count))
+    print("validations interned:     {kib:10.1f} KiB".format(kib=interned / 1024))
+    print("validations not interned: {kib:10.1f} KiB".format(kib=not_interned_allocated / 1024))
+    print("savings:                  {percent:10.1f} %".format(
+        percent=100 * (1 - interned / not_interned_allocated)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -1,15 +1,41 @@
 from parameters_validation.builtin_validations import non_empty, non_null, \
-    non_blank, no_whitespaces, non_negative, strongly_typed
+    non_blank, no_whitespaces, non_negative, strongly_typed, as_int, as_uuid, as_datetime
 from parameters_validation.validate_parameters_decorator import validate_parameters
-from parameters_validation.parameter_validation_decorator import parameter_validation
+from parameters_validation.parameter_validation_decorator import parameter_validation, \
+    ParameterValidation
+from parameters_validation.validate_fields_decorator import validate_fields
+from parameters_validation.sampling_policy import SamplingPolicy, set_sampling_policy, \
+    get_sampling_policy
+from parameters_validation.trusted_context import trusted, is_trusted
+from parameters_validation.validation_result import ValidationResult
+from parameters_validation.exceptions import ParametersValidationError
+from parameters_validation.failure_log import FailureRecord, enable_failure_log, disable_failure_log, \
+    get_recent_failures, dump_recent_failures
 
 __all__ = [
     validate_parameters,
+    validate_fields,
     parameter_validation,
+    ParameterValidation,
+    trusted,
+    is_trusted,
+    SamplingPolicy,
+    set_sampling_policy,
+    get_sampling_policy,
+    ValidationResult,
+    ParametersValidationError,
+    FailureRecord,
+    enable_failure_log,
+    disable_failure_log,
+    get_recent_failures,
+    dump_recent_failures,
     non_blank,
     non_null,
     non_empty,
     no_whitespaces,
     non_negative,
     strongly_typed,
+    as_int,
+    as_uuid,
+    as_datetime,
 ]
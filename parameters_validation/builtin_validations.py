@@ -1,13 +1,22 @@
+from abc import ABCMeta, get_cache_token
+from datetime import datetime
+from functools import lru_cache, partial
 from numbers import Number
 from typing import Sized
+from uuid import UUID
 
 from parameters_validation.parameter_validation_decorator import parameter_validation
 
+_TYPE_DECISIONS_MAX_SIZE = 1024
+_type_decisions = {}
+_type_decisions_token = get_cache_token()
+_NATIVELY_CACHED_METACLASSES = (type, ABCMeta)
 
-@parameter_validation
+
+@parameter_validation(requires_type=True)
 def strongly_typed(param: object, arg_name: str, arg_type: type):
     """
-    Validation to reject null, empty or blank strings.
+    Validation to reject parameters that are not instances of the expected type.
 
     >>> from parameters_validation import validate_parameters
     ...
@@ -19,21 +28,23 @@ def strongly_typed(param: object, arg_name: str, arg_type: type):
     ... foo(None)  # invalid: NoneType does not inherit from string
     ... foo(1)     # invalid: integer does not inherit from string
 
+    Decisions for typing aliases of ABCs (e.g. `typing.Sized`, `typing.Mapping`) are
+    cached per `type(param)`, so repeated checks of values of the same type cost a
+    single dict lookup. The cache is bounded and is invalidated whenever a class is
+    registered to any ABC. Plain classes and ABCs such as `numbers.Number` are already
+    cached natively by `isinstance`, while protocols and classes with custom
+    metaclasses may depend on the value itself and are checked on every call.
+
     :param param: the parameter's value being validated
     :param arg_name: the argument name for this parameter (provided by the :meth:`parameter_validation` decorator)
     :param arg_type: the argument type for this parameter (provided by the :meth:`parameter_validation` decorator)
-    :return: None
-    :raises TypeError: invalid parameter, i.e. :param param: has type that doesn't inherits from the expected :param arg_type:
+    :return: the validation error, if any
+    :raises TypeError: invalid parameter, i.e. :param param: has type that doesn't inherits from the expected :param arg_type:,
+                       or, at function definition time, :param arg_type: is missing or is not a type
     """
-    validation_error = None
-    arg = _build_arg(arg_name, arg_type)
-    try:
-        if not isinstance(param, arg_type):
-            validation_error = TypeError("`{arg}` must be of type `{arg_type}`".format(arg=arg, arg_type=arg_type))
-    except:  # TODO: fail at function definition time
-        raise RuntimeError("`strongly_typed` validation must receive the type to enforce")
-    if validation_error:
-        raise validation_error
+    if not _is_instance(param, arg_type):
+        arg = _build_arg(arg_name, arg_type)
+        return TypeError("`{arg}` must be of type `{arg_type}`".format(arg=arg, arg_type=arg_type))
 
 
 @parameter_validation
@@ -55,7 +66,7 @@ def non_blank(string: str, arg_name: str, arg_type: type = str):
     :param string: the parameter's value being validated
     :param arg_name: the argument name for this parameter (provided by the :meth:`parameter_validation` decorator)
     :param arg_type: the argument type for this parameter (provided by the :meth:`parameter_validation` decorator)
-    :return: None
+    :return: the validation error, if any
     :raises ValueError: invalid parameter, i.e. :param string: is either of type `NoneType`, empty (no length) or blank (contains just whitespaces)
     :raises RuntimeError: unable to validate parameter (possibly :param string: is of an unexpected type)
     """
@@ -68,8 +79,7 @@ def non_blank(string: str, arg_name: str, arg_type: type = str):
     except Exception as e:
         validation_error = RuntimeError(
             "Unable to validate parameter `{arg}`: {error_name}{error}".format(arg=arg, error_name=e.__class__.__name__, error=e), e)
-    if validation_error:
-        raise validation_error
+    return validation_error
 
 
 @parameter_validation
@@ -90,12 +100,12 @@ def non_null(obj: object, arg_name: str, arg_type: type = object):
     :param obj: the parameter's value being validated
     :param arg_name: the argument name for this parameter (provided by the :meth:`parameter_validation` decorator)
     :param arg_type: the argument type for this parameter (provided by the :meth:`parameter_validation` decorator)
-    :return: None
+    :return: the validation error, if any
     :raises ValueError: invalid parameter, i.e. :param obj: is of type `NoneType`
     """
     arg = _build_arg(arg_name, arg_type)
     if obj is None:
-        raise ValueError("Parameter `{arg}` cannot not be None".format(arg=arg))
+        return ValueError("Parameter `{arg}` cannot not be None".format(arg=arg))
 
 
 @parameter_validation
@@ -117,7 +127,7 @@ def non_empty(obj: Sized, arg_name: str, arg_type: type = object):
     :param obj: the parameter's value being validated
     :param arg_name: the argument name for this parameter (provided by the :meth:`parameter_validation` decorator)
     :param arg_type: the argument type for this parameter (provided by the :meth:`parameter_validation` decorator)
-    :return: None
+    :return: the validation error, if any
     :raises ValueError: invalid parameter, i.e. :param obj: has size zero (no length)
     :raises RuntimeError: unable to validate parameter (possibly the parameter is of an unexpected type)
     """
@@ -129,8 +139,7 @@ def non_empty(obj: Sized, arg_name: str, arg_type: type = object):
     except Exception as e:
         validation_error = RuntimeError(
             "Unable to validate parameter `{arg}`: {error_name}{error}".format(arg=arg, error_name=e.__class__.__name__, error=e), e)
-    if validation_error:
-        raise validation_error
+    return validation_error
 
 
 @parameter_validation
@@ -152,7 +161,7 @@ def no_whitespaces(string: str, arg_name: str, arg_type: type = str):
     :param string: the parameter's value being validated
     :param arg_name: the argument name for this parameter (provided by the :meth:`parameter_validation` decorator)
     :param arg_type: the argument type for this parameter (provided by the :meth:`parameter_validation` decorator)
-    :return: None
+    :return: the validation error, if any
     :raises ValueError: invalid parameter, i.e. :param string: contains one or more whitespaces
     :raises RuntimeError: unable to validate parameter (possibly :param string: is of an unexpected type)
     """
@@ -165,8 +174,7 @@ def no_whitespaces(string: str, arg_name: str, arg_type: type = str):
     except Exception as e:
         validation_error = RuntimeError(
             "Unable to validate parameter `{arg}`: {error_name}{error}".format(arg=arg, error_name=e.__class__.__name__, error=e), e)
-    if validation_error:
-        raise validation_error
+    return validation_error
 
 
 @parameter_validation
@@ -186,7 +194,7 @@ def non_negative(number: Number, arg_name: str, arg_type: type = str):
     :param number: the parameter's value being validated
     :param arg_name: the argument name for this parameter (provided by the :meth:`parameter_validation` decorator)
     :param arg_type: the argument type for this parameter (provided by the :meth:`parameter_validation` decorator)
-    :return: None
+    :return: the validation error, if any
     :raises ValueError: invalid parameter, i.e. :param number: contains one or more whitespaces
     :raises RuntimeError: unable to validate parameter (possibly :param number: is of an unexpected type)
     """
@@ -199,8 +207,96 @@ def non_negative(number: Number, arg_name: str, arg_type: type = str):
     except Exception as e:
         validation_error = RuntimeError(
             "Unable to validate parameter `{arg}`: {error_name}{error}".format(arg=arg, error_name=e.__class__.__name__, error=e), e)
-    if validation_error:
-        raise validation_error
+    return validation_error
+
+
+@parameter_validation(transform=True)
+def as_int(string: str, arg_name: str, arg_type: type = str):
+    """
+    Transforming validation to parse integers, passing the parsed `int` to the
+    decorated function.
+
+    >>> from parameters_validation import validate_parameters
+    ...
+    ... @validate_parameters
+    ... def foo(bar: as_int(str)):
+    ...     print(bar + 1)
+    ...
+    ... foo("41")   # valid: prints 42
+    ... foo("4.2")  # invalid: string is not an integer
+
+    :param string: the parameter's value being validated
+    :param arg_name: the argument name for this parameter (provided by the :meth:`parameter_validation` decorator)
+    :param arg_type: the argument type for this parameter (provided by the :meth:`parameter_validation` decorator)
+    :return: the parsed integer or the validation error
+    :raises ValueError: invalid parameter, i.e. :param string: is not an integer
+    """
+    try:
+        return int(string)
+    except (TypeError, ValueError):
+        return ValueError("Parameter `{arg}` must be an integer".format(arg=_build_arg(arg_name, arg_type)))
+
+
+@parameter_validation(transform=True)
+def as_uuid(string: str, arg_name: str, arg_type: type = str):
+    """
+    Transforming validation to parse UUIDs, passing the parsed :class:`uuid.UUID` to
+    the decorated function.
+
+    >>> from parameters_validation import validate_parameters
+    ...
+    ... @validate_parameters
+    ... def foo(bar: as_uuid(str)):
+    ...     print(bar.version)
+    ...
+    ... foo("6f1d3b1c-5f5e-4a8e-9d2a-0c0b9c2d7e4f")  # valid: prints 4
+    ... foo("6f1d3b1c")                              # invalid: string is not an UUID
+
+    :param string: the parameter's value being validated
+    :param arg_name: the argument name for this parameter (provided by the :meth:`parameter_validation` decorator)
+    :param arg_type: the argument type for this parameter (provided by the :meth:`parameter_validation` decorator)
+    :return: the parsed UUID or the validation error
+    :raises ValueError: invalid parameter, i.e. :param string: is not an UUID
+    """
+    try:
+        return UUID(string)
+    except (AttributeError, TypeError, ValueError):
+        return ValueError("Parameter `{arg}` must be an UUID".format(arg=_build_arg(arg_name, arg_type)))
+
+
+@lru_cache(maxsize=None)
+def as_datetime(fmt: str):
+    """
+    Transforming validation to parse datetimes in the given format, passing the
+    parsed :class:`datetime.datetime` to the decorated function.
+
+    >>> from parameters_validation import validate_parameters
+    ...
+    ... @validate_parameters
+    ... def foo(bar: as_datetime("%Y-%m-%d")(str)):
+    ...     print(bar.year)
+    ...
+    ... foo("2019-06-01")  # valid: prints 2019
+    ... foo("01/06/2019")  # invalid: string is not in the expected format
+
+    :param fmt: the :meth:`datetime.datetime.strptime` format of the parameter
+    :return: the validation, to be applied to the argument type like other validations
+    :raises ValueError: invalid parameter, i.e. the string is not a datetime in the given format
+    """
+    @parameter_validation(transform=True)
+    def as_datetime(string: str, arg_name: str, arg_type: type = str):
+        try:
+            return datetime.strptime(string, fmt)
+        except (TypeError, ValueError):
+            return ValueError("Parameter `{arg}` must be a datetime in the format `{fmt}`".format(
+                arg=_build_arg(arg_name, arg_type), fmt=fmt))
+
+    as_datetime._pickle_as = partial(_build_as_datetime, fmt)
+    return as_datetime
+
+
+def _build_as_datetime(fmt: str, arg_type: type):
+    return as_datetime(fmt)(arg_type)
 
 
 def _build_arg(arg_name, arg_type):
@@ -211,3 +307,21 @@ def _build_arg(arg_name, arg_type):
         except AttributeError:
             arg += " <{t}>".format(t=arg_type._name)
     return arg
+
+
+def _is_instance(obj, arg_type) -> bool:
+    global _type_decisions_token
+    if type(arg_type) in _NATIVELY_CACHED_METACLASSES or type(getattr(arg_type, "__origin__", None)) is not ABCMeta:
+        return isinstance(obj, arg_type)
+    token = get_cache_token()
+    if token != _type_decisions_token or len(_type_decisions) >= _TYPE_DECISIONS_MAX_SIZE:
+        _type_decisions.clear()
+        _type_decisions_token = token
+    key = (arg_type, type(obj))
+    try:
+        decision = _type_decisions.get(key)
+    except TypeError:
+        return isinstance(obj, arg_type)
+    if decision is None:
+        decision = _type_decisions[key] = isinstance(obj, arg_type)
+    return decision
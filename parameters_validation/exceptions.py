@@ -0,0 +1,95 @@
+import reprlib
+
+_MAX_VALUE_REPR_LENGTH = 80
+
+
+class _BoundedRepr(reprlib.Repr):
+    def __init__(self):
+        super().__init__()
+        self.maxstring = self.maxlong = _MAX_VALUE_REPR_LENGTH
+
+    def repr_str(self, x, level):
+        return repr(x[:self.maxstring])
+
+    repr_bytes = repr_bytearray = repr_str
+
+    def repr_instance(self, x, level):
+        return repr(x)
+
+
+_bounded_repr = _BoundedRepr().repr
+
+
+def _truncated(text: str, max_length: int = _MAX_VALUE_REPR_LENGTH) -> str:
+    if len(text) > max_length:
+        return text[:max_length - 3] + "..."
+    return text
+
+
+def _truncated_repr(value) -> str:
+    try:
+        value_repr = _bounded_repr(value)
+    except Exception as e:
+        value_repr = "<unrepresentable {type}: {error_name}>".format(
+            type=type(value).__name__, error_name=e.__class__.__name__)
+    return _truncated(value_repr)
+
+
+class ParametersValidationError(ValueError):
+    """
+    Error aggregating every parameter validation failure of a call, raised by
+    functions decorated with `@validate_parameters(collect_errors=True)`.
+
+    `failures` holds a `(parameter, value, error)` tuple per failed parameter, where
+    `error` is the exception its validation would have raised on its own, created
+    without a traceback.
+
+    >>> from parameters_validation import non_blank, non_negative, validate_parameters
+    ...
+    ... @validate_parameters(collect_errors=True)
+    ... def register(name: non_blank(str), age: non_negative(int)):
+    ...     pass
+    ...
+    ... try:
+    ...     register("", -1)
+    ... except ParametersValidationError as e:
+    ...     e.to_dict()  # {"errors": [{"parameter": "name", ...}, {"parameter": "age", ...}]}
+
+    :param function: qualified name of the function whose call failed validation
+    :param failures: `(parameter, value, error)` tuples of the failed parameters
+    """
+
+    def __init__(self, function: str, failures: list):
+        self.function = function
+        self.failures = tuple(failures)
+        super().__init__("Invalid parameters for `{function}`: {errors}".format(
+            function=function,
+            errors="; ".join(str(error) for _, _, error in self.failures),
+        ))
+
+    def __reduce__(self):
+        return type(self), (self.function, self.failures)
+
+    @property
+    def parameters(self) -> tuple:
+        return tuple(parameter for parameter, _, _ in self.failures)
+
+    def to_dict(self) -> dict:
+        """
+        Serializable description of the failures, e.g. for a `400 Bad Request`
+        response body.
+
+        :return: dict with an `errors` list holding the `parameter` name, truncated
+                 `value` repr, error `type` name and `message` of each failure
+        """
+        return {
+            "errors": [
+                {
+                    "parameter": parameter,
+                    "value": _truncated_repr(value),
+                    "type": error.__class__.__name__,
+                    "message": str(error),
+                }
+                for parameter, value, error in self.failures
+            ]
+        }
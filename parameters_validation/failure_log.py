@@ -0,0 +1,168 @@
+import json
+import os
+import traceback
+from collections import deque
+from threading import Lock
+from time import time
+from weakref import WeakKeyDictionary
+
+from parameters_validation.exceptions import _truncated, _truncated_repr
+
+_MAX_ERROR_LENGTH = 200
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+
+class FailureRecord:
+    """
+    A validation failure recorded by the :class:`FailureLog`.
+
+    Only strings are kept, never the failed value nor the exception itself, so a
+    record's size is bounded: `value` is a truncated repr of the value, `error` the
+    truncated message of the exception and `stack` the last frames of the caller's
+    stack formatted as `"file:line in function"`, if stacks are recorded.
+    """
+    __slots__ = ("function", "parameter", "validator", "value", "error_type", "error", "timestamp", "stack")
+
+    def __init__(self, function: str, parameter: str, validator: str, value: str, error_type: str, error: str,
+                 timestamp: float, stack: tuple = None):
+        self.function = function
+        self.parameter = parameter
+        self.validator = validator
+        self.value = value
+        self.error_type = error_type
+        self.error = error
+        self.timestamp = timestamp
+        self.stack = stack
+
+    def to_dict(self) -> dict:
+        return {
+            "function": self.function,
+            "parameter": self.parameter,
+            "validator": self.validator,
+            "value": self.value,
+            "type": self.error_type,
+            "message": self.error,
+            "timestamp": self.timestamp,
+            "stack": None if self.stack is None else list(self.stack),
+        }
+
+    def __repr__(self):
+        return "FailureRecord(function={f!r}, parameter={p!r}, value={v}, error={e!r})".format(
+            f=self.function, p=self.parameter, v=self.value, e=self.error)
+
+
+class FailureLog:
+    """
+    Fixed-size ring buffers of the most recent validation failures of functions
+    decorated with :meth:`validate_parameters`: one process-wide and one per decorated
+    function, which is discarded along with the function. Once a buffer is full, each
+    new failure evicts its oldest record.
+
+    Failures are recorded on the failure path only, so calls that pass validation are
+    not slowed down.
+
+    :param size: number of failures kept process-wide
+    :param per_function_size: number of failures kept per function
+    :param stack_depth: number of the caller's stack frames kept per failure
+    """
+
+    def __init__(self, size: int = 100, per_function_size: int = 10, stack_depth: int = 0):
+        if size < 1 or per_function_size < 1:
+            raise ValueError("`size` and `per_function_size` must be positive")
+        if stack_depth < 0:
+            raise ValueError("`stack_depth` must not be negative")
+        self.size = size
+        self.per_function_size = per_function_size
+        self.stack_depth = stack_depth
+        self._failures = deque(maxlen=size)
+        self._function_failures = WeakKeyDictionary()
+        self._lock = Lock()
+
+    def _get_stack(self) -> tuple:
+        stack = []
+        for frame, line in traceback.walk_stack(None):
+            code = frame.f_code
+            if code.co_filename.startswith(_PACKAGE_DIRECTORY):
+                continue
+            stack.append("{file}:{line} in {function}".format(file=code.co_filename, line=line, function=code.co_name))
+            if len(stack) == self.stack_depth:
+                break
+        return tuple(reversed(stack))
+
+    def record(self, f: callable, parameter: str, validator, value, error: Exception):
+        function = "{module}.{function}".format(module=f.__module__, function=f.__qualname__)
+        failure = FailureRecord(
+            function,
+            parameter,
+            _truncated_repr(validator),
+            _truncated_repr(value),
+            error.__class__.__name__,
+            _truncated(str(error), _MAX_ERROR_LENGTH),
+            time(),
+            self._get_stack() if self.stack_depth else None,
+        )
+        function_failures = self._function_failures.get(f)
+        if function_failures is None:
+            with self._lock:
+                function_failures = self._function_failures.setdefault(f, deque(maxlen=self.per_function_size))
+        function_failures.append(failure)
+        self._failures.append(failure)
+
+    def failures(self, f: callable = None) -> list:
+        """
+        :param f: decorated function whose failures to return, or `None` for the
+                  process-wide failures
+        :return: the recorded :class:`FailureRecord` list, from the oldest to the newest
+        """
+        if f is None:
+            return list(self._failures)
+        return list(self._function_failures.get(f, ()))
+
+
+_failure_log = None
+
+
+def enable_failure_log(size: int = 100, per_function_size: int = 10, stack_depth: int = 0) -> FailureLog:
+    """
+    Start recording the most recent validation failures of functions decorated with
+    :meth:`validate_parameters`, replacing any previously recorded failures.
+
+    >>> enable_failure_log(size=1000, stack_depth=5)
+
+    :param size: number of failures kept process-wide
+    :param per_function_size: number of failures kept per function
+    :param stack_depth: number of the caller's stack frames kept per failure
+    :return: the active :class:`FailureLog`
+    """
+    global _failure_log
+    _failure_log = FailureLog(size, per_function_size, stack_depth)
+    return _failure_log
+
+
+def disable_failure_log():
+    """
+    Stop recording validation failures and discard the recorded ones.
+    """
+    global _failure_log
+    _failure_log = None
+
+
+def get_recent_failures(f: callable = None) -> list:
+    """
+    :param f: decorated function whose failures to return, or `None` for the
+              process-wide failures
+    :return: the recorded :class:`FailureRecord` list, from the oldest to the newest
+    """
+    if _failure_log is None:
+        return []
+    return _failure_log.failures(f)
+
+
+def dump_recent_failures(f: callable = None, **kwargs) -> str:
+    """
+    :param f: decorated function whose failures to dump, or `None` for the
+              process-wide failures
+    :param kwargs: keyword arguments for :meth:`json.dumps`, e.g. `indent`
+    :return: JSON array of the recorded failures, from the oldest to the newest
+    """
+    return json.dumps([failure.to_dict() for failure in get_recent_failures(f)], **kwargs)
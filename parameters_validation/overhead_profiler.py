@@ -0,0 +1,177 @@
+from functools import wraps
+from threading import Lock, local
+
+try:
+    from time import perf_counter_ns
+except ImportError:  # Python < 3.7
+    from time import perf_counter
+
+    def perf_counter_ns() -> int:
+        return int(perf_counter() * 1e9)
+
+_CALIBRATION_CALLS = 1000
+
+
+class FunctionOverhead:
+    """
+    Validation overhead measured for a function decorated with
+    :meth:`validate_parameters`, i.e. the time its calls spend outside the decorated
+    function itself. Times are in nanoseconds.
+
+    Only calls that reached the decorated function are measured: calls rejected by
+    validation are only counted, in `rejected`.
+    """
+    __slots__ = ("function", "calls", "rejected", "overhead", "bare")
+
+    def __init__(self, function: str):
+        self.function = function
+        self.calls = 0
+        self.rejected = 0
+        self.overhead = 0
+        self.bare = 0
+
+    @property
+    def overhead_per_call(self) -> float:
+        return self.overhead / self.calls if self.calls else 0.0
+
+    @property
+    def bare_per_call(self) -> float:
+        return self.bare / self.calls if self.calls else 0.0
+
+    @property
+    def ratio(self) -> float:
+        if self.bare:
+            return self.overhead / self.bare
+        return float("inf") if self.overhead else 0.0
+
+    def __repr__(self):
+        return "FunctionOverhead({function!r}, calls={calls}, overhead_per_call={overhead:.0f}ns, ratio={ratio:.2f})" \
+            .format(function=self.function, calls=self.calls, overhead=self.overhead_per_call, ratio=self.ratio)
+
+
+class _BareTime(local):
+    elapsed = 0
+
+
+class OverheadProfiler:
+    """
+    Measures, per function decorated with :meth:`validate_parameters`, the time spent
+    in validations apart from the time spent in the decorated function.
+
+    Like the sampling policy, profiling is resolved when functions are decorated: only
+    functions decorated while profiling is enabled (see :meth:`enable_profiling`) are
+    measured. The cost of the measurement itself is calibrated away.
+
+    :param clock: function returning the current time in nanoseconds
+    """
+
+    def __init__(self, clock: callable = perf_counter_ns):
+        self._clock = clock
+        self._lock = Lock()
+        self._results = {}
+        self._bare_time = _BareTime()
+        self._offset = self._calibrate()
+
+    def _calibrate(self) -> int:
+        timed = self.time_call(_noop)
+        bare_time = self._bare_time
+        clock = self._clock
+        offset = None
+        for _ in range(_CALIBRATION_CALLS):
+            start = clock()
+            timed()
+            elapsed = clock() - start - bare_time.elapsed
+            offset = elapsed if offset is None else min(offset, elapsed)
+        bare_time.elapsed = 0
+        return offset
+
+    def time_call(self, f: callable) -> callable:
+        bare_time = self._bare_time
+        clock = self._clock
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                bare_time.elapsed = clock() - start
+
+        return timed
+
+    def time_wrapper(self, f: callable, wrapper: callable) -> callable:
+        name = "{module}.{function}".format(module=f.__module__, function=f.__qualname__)
+        with self._lock:
+            result = self._results.setdefault(name, FunctionOverhead(name))
+        bare_time = self._bare_time
+        offset = self._offset
+        lock = self._lock
+        clock = self._clock
+
+        @wraps(f)
+        def profiled(*args, **kwargs):
+            outer_bare = bare_time.elapsed
+            bare_time.elapsed = None
+            start = clock()
+            try:
+                return wrapper(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                bare = bare_time.elapsed
+                bare_time.elapsed = outer_bare
+                with lock:
+                    if bare is None:
+                        result.rejected += 1
+                    else:
+                        result.calls += 1
+                        result.overhead += max(0, elapsed - bare - offset)
+                        result.bare += bare
+
+        return profiled
+
+    def results(self) -> list:
+        """
+        :return: the :class:`FunctionOverhead` of every profiled function that was
+                 called, from the highest total overhead to the lowest
+        """
+        with self._lock:
+            results = [result for result in self._results.values() if result.calls]
+        return sorted(results, key=lambda result: result.overhead, reverse=True)
+
+
+def _noop():
+    pass
+
+
+_profiler = None
+
+
+def enable_profiling() -> OverheadProfiler:
+    """
+    Start measuring the validation overhead of the functions decorated with
+    :meth:`validate_parameters` from now on.
+
+    :return: the active :class:`OverheadProfiler`
+    """
+    global _profiler
+    if _profiler is None:
+        _profiler = OverheadProfiler()
+    return _profiler
+
+
+def disable_profiling() -> OverheadProfiler:
+    """
+    Stop profiling functions decorated from now on. Functions already decorated keep
+    being measured by the returned profiler.
+
+    :return: the profiler that was active, if any
+    """
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler
+
+
+def get_profiler() -> OverheadProfiler:
+    """
+    :return: the active :class:`OverheadProfiler`, if any
+    """
+    return _profiler
@@ -1,8 +1,296 @@
 import inspect
 from functools import wraps
+from weakref import WeakValueDictionary
 
+from parameters_validation.validation_result import ValidationResult, VALID
 
-def parameter_validation(func):
+_PASS = -1
+_FAIL = -2
+_interned = WeakValueDictionary()
+
+
+class _Label:
+    def __init__(self):
+        self.index = None
+
+
+def _resolve(target) -> int:
+    if isinstance(target, _Label):
+        return target.index
+    return target
+
+
+def _compile(expression) -> tuple:
+    instructions = []
+
+    def emit(node, on_pass, on_fail, context):
+        kind = node[0]
+        if kind == "step":
+            instructions.append((node[1], node[2], on_pass, on_fail, context))
+        elif kind == "and":
+            right = _Label()
+            emit(node[1], right, on_fail, context)
+            right.index = len(instructions)
+            emit(node[2], on_pass, on_fail, context)
+        elif kind == "or":
+            right = _Label()
+            emit(node[1], on_pass, right, context or node)
+            right.index = len(instructions)
+            emit(node[2], on_pass, on_fail, context or node)
+        else:
+            emit(node[1], on_fail, on_pass, context or node)
+
+    emit(expression, _PASS, _FAIL, None)
+    return tuple(
+        (validation, arg_type, _resolve(on_pass), _resolve(on_fail), on_fail is not _FAIL or context is not None,
+         context)
+        for validation, arg_type, on_pass, on_fail, context in instructions
+    )
+
+
+def _as_chain(plan: tuple):
+    for index, (_, _, on_pass, on_fail, _, _) in enumerate(plan):
+        if on_fail != _FAIL or on_pass not in (index + 1, _PASS):
+            return None
+    return tuple((validation, arg_type, validation._transforms) for validation, arg_type, _, _, _, _ in plan)
+
+
+def _transforms(plan: tuple) -> bool:
+    return any(validation._transforms for validation, _, _, _, _, _ in plan)
+
+
+def _composition_error(expression, arg_name: str, cause: Exception = None) -> Exception:
+    if expression[0] == "not":
+        return ValueError("Parameter `{arg}` must not satisfy `{validation}`".format(
+            arg=arg_name, validation=_describe(expression[1])))
+    error_type = TypeError if isinstance(cause, TypeError) else ValueError
+    error = error_type("Parameter `{arg}` must satisfy `{validation}`".format(
+        arg=arg_name, validation=_describe(expression)))
+    error.__cause__ = cause
+    return error
+
+
+def _describe(expression) -> str:
+    kind = expression[0]
+    if kind == "step":
+        arg_type = expression[2]
+        type_name = getattr(arg_type, "__name__", None) or getattr(arg_type, "_name", None)
+        if arg_type is None:
+            type_name = ""
+        elif type_name is None:
+            type_name = repr(arg_type)
+        return "{name}({type_name})".format(name=expression[1].__name__, type_name=type_name)
+    if kind == "not":
+        return "~{operand}".format(operand=_describe(expression[1]))
+    operator = "&" if kind == "and" else "|"
+    return "({left} {operator} {right})".format(
+        left=_describe(expression[1]), operator=operator, right=_describe(expression[2]))
+
+
+def _evaluate(plan: tuple, parameter, arg_name: str):
+    index = 0
+    while True:
+        validation, arg_type, on_pass, on_fail, guarded, context = plan[index]
+        if guarded:
+            try:
+                error = validation(parameter, arg_name, arg_type)
+            except Exception as e:
+                error = e.with_traceback(None)
+        else:
+            error = validation(parameter, arg_name, arg_type)
+        index = on_pass if error is None else on_fail
+        if index == _PASS:
+            return None
+        if index == _FAIL:
+            if context is None:
+                return error
+            return _composition_error(context, arg_name, error)
+
+
+def _evaluate_expression(expression, parameter, arg_name: str) -> tuple:
+    kind = expression[0]
+    if kind == "step":
+        validation, arg_type = expression[1], expression[2]
+        try:
+            if validation._transforms:
+                return validation(parameter, arg_name, arg_type)
+            return validation(parameter, arg_name, arg_type), parameter
+        except Exception as e:
+            return e.with_traceback(None), parameter
+    if kind == "not":
+        error, _ = _evaluate_expression(expression[1], parameter, arg_name)
+        if error is None:
+            return _composition_error(expression, arg_name), parameter
+        return None, parameter
+    error, value = _evaluate_expression(expression[1], parameter, arg_name)
+    if kind == "and":
+        if error is not None:
+            return error, parameter
+        return _evaluate_expression(expression[2], value, arg_name)
+    if error is None:
+        return None, value
+    error, value = _evaluate_expression(expression[2], parameter, arg_name)
+    if error is None:
+        return None, value
+    return _composition_error(expression, arg_name, error), parameter
+
+
+def _get_key(expression) -> tuple:
+    if expression[0] == "step":
+        return expression + (type(expression[2]),)
+    return (expression[0],) + tuple(_get_key(operand) for operand in expression[1:])
+
+
+class ParameterValidation:
+    """
+    Validation applied to a parameter by :meth:`validate_parameters`, as built by the
+    functions decorated with :meth:`parameter_validation`.
+
+    Validations can be combined with `&` (and), `|` (or) and `~` (not). Combined
+    validations are compiled into a flat short-circuit evaluation plan, e.g. in
+    `non_blank(str) | non_null()` the second validation only runs when the first one
+    fails. When a `|` or `~` fails, the error describes the whole alternative or
+    negation, e.g. "Parameter `name` must satisfy `(non_blank(str) | ~non_null())`".
+
+    >>> from parameters_validation import non_blank, non_empty, no_whitespaces
+    ...
+    ... optional_name = non_blank(str) | ~non_null()
+    ... tag = non_empty(str) & no_whitespaces(str)
+
+    Calling a validation returns the parameter's value, converted by the transforming
+    validations in it (see :meth:`parameter_validation`). Transformations are threaded
+    through `&` and nesting, while only the transformations of the alternative that
+    succeeded apply in `|`.
+
+    Validations are immutable and interned: building the same validation twice, e.g.
+    `non_null(str)` in the signature of many functions, returns a single shared
+    instance. They are pickled by the qualified name of the functions decorated with
+    :meth:`parameter_validation`, so they can be sent to other processes as long as
+    those functions are importable there.
+    """
+    __slots__ = ("_expression", "_arg_type", "_plan", "_chain", "_transforms", "__weakref__")
+    _parameter_validation = True
+
+    def __new__(cls, expression, arg_type):
+        key = _get_key(expression)
+        try:
+            return _interned[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return cls._build(expression, arg_type)
+        return _interned.setdefault(key, cls._build(expression, arg_type))
+
+    @classmethod
+    def _build(cls, expression, arg_type):
+        self = super().__new__(cls)
+        plan = _compile(expression)
+        object.__setattr__(self, "_expression", expression)
+        object.__setattr__(self, "_arg_type", arg_type)
+        object.__setattr__(self, "_plan", plan)
+        object.__setattr__(self, "_chain", _as_chain(plan))
+        object.__setattr__(self, "_transforms", _transforms(plan))
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError("`{cls}` objects are immutable".format(cls=type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("`{cls}` objects are immutable".format(cls=type(self).__name__))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __call__(self, parameter, arg_name: str):
+        if self._chain is not None:
+            for validation, arg_type, transforms in self._chain:
+                if transforms:
+                    error, parameter = validation(parameter, arg_name, arg_type)
+                else:
+                    error = validation(parameter, arg_name, arg_type)
+                if error is not None:
+                    raise error
+            return parameter
+        if self._transforms:
+            error, parameter = _evaluate_expression(self._expression, parameter, arg_name)
+        else:
+            error = _evaluate(self._plan, parameter, arg_name)
+        if error is not None:
+            raise error
+        return parameter
+
+    def check(self, parameter, arg_name: str) -> ValidationResult:
+        """
+        Apply this validation without raising exceptions.
+
+        :param parameter: the parameter's value being validated
+        :param arg_name: the argument name for this parameter
+        :return: the :class:`ValidationResult` of the validation
+        """
+        if self._transforms:
+            error, value = _evaluate_expression(self._expression, parameter, arg_name)
+            if error is None:
+                return ValidationResult(value=value)
+            return ValidationResult(arg_name, error)
+        try:
+            error = _evaluate(self._plan, parameter, arg_name)
+        except Exception as e:
+            error = e.with_traceback(None)
+        if error is None:
+            return VALID
+        return ValidationResult(arg_name, error)
+
+    def __and__(self, other):
+        if not isinstance(other, ParameterValidation):
+            return NotImplemented
+        return ParameterValidation(("and", self._expression, other._expression), self._arg_type)
+
+    def __or__(self, other):
+        if not isinstance(other, ParameterValidation):
+            return NotImplemented
+        return ParameterValidation(("or", self._expression, other._expression), self._arg_type)
+
+    def __invert__(self):
+        return ParameterValidation(("not", self._expression), self._arg_type)
+
+    def __reduce__(self):
+        return _rebuild_validation, (_get_recipe(self._expression),)
+
+    def __repr__(self):
+        return _describe(self._expression)
+
+
+def _get_recipe(expression) -> tuple:
+    kind = expression[0]
+    if kind == "step":
+        factory = expression[1]._factory
+        return kind, getattr(factory, "_pickle_as", factory), expression[2]
+    return (kind,) + tuple(_get_recipe(operand) for operand in expression[1:])
+
+
+def _rebuild_validation(recipe) -> ParameterValidation:
+    kind = recipe[0]
+    if kind == "step":
+        return recipe[1](recipe[2])
+    if kind == "not":
+        return ~_rebuild_validation(recipe[1])
+    if kind == "and":
+        return _rebuild_validation(recipe[1]) & _rebuild_validation(recipe[2])
+    return _rebuild_validation(recipe[1]) | _rebuild_validation(recipe[2])
+
+
+def _check_type(func: callable, arg_type):
+    try:
+        isinstance(None, arg_type)
+    except TypeError:
+        raise TypeError("`{name}` validation must receive the type to enforce, got `{arg_type!r}`".format(
+            name=func.__name__, arg_type=arg_type)) from None
+
+
+def parameter_validation(func: callable = None, *, transform: bool = False, requires_type: bool = False):
     """
     Decorator to make the function to be applied as parameter validation when used
     together with the :meth:`parameter_validation.validate_parameters` decorator.
@@ -20,33 +308,95 @@ def parameter_validation(func):
     ... foo(5)    # validation will succeed
     ... foo(400)  # validation will fail
 
+    Instead of raising, a validation may return the exception describing the failure.
+    :meth:`validate_parameters` raises it all the same, while the non-raising `.check`
+    API reports it without the cost of raising and catching an exception:
+
+    >>> @parameter_validation
+    ... def even(param: int, arg_name: str):
+    ...     if param % 2 != 0:
+    ...         return ValueError("`{n}` must be even".format(n=arg_name))
+    ...
+    ... even(int).check(3, "x")  # ValidationResult(arg_name='x', error=ValueError(...))
+
+    Validations can be combined with `&`, `|` and `~` (see :class:`ParameterValidation`):
+
+    >>> from parameters_validation import non_null
+    ...
+    ... @validate_parameters
+    ... def bar(x: even(int) | ~non_null()):
+    ...     print(x)
+    ...
+    ... bar(None)  # validation will succeed
+
+    With `transform=True` the validation returns the parameter's value converted to
+    what the decorated function expects, and :meth:`validate_parameters` calls the
+    function with the converted value instead, so it is parsed just once:
+
+    >>> @parameter_validation(transform=True)
+    ... def as_even(param: str, arg_name: str):
+    ...     value = int(param)
+    ...     if value % 2 != 0:
+    ...         return ValueError("`{n}` must be even".format(n=arg_name))
+    ...     return value
+    ...
+    ... @validate_parameters
+    ... def baz(x: as_even(str)):
+    ...     print(x + 1)
+    ...
+    ... baz("2")  # prints 3
+
+    Annotations with transforming validations run on every call, even within
+    :meth:`trusted` contexts, calls left out by sampling and `skip_validations()`, so
+    the decorated function never receives unconverted values.
+
+    With `requires_type=True` the validation must be given a type usable with
+    `isinstance`, e.g. `strongly_typed(int)`, and building it without one raises
+    `TypeError` at function definition time rather than failing on every call.
+
     :param func: decorated function
+    :param transform: whether the decorated function returns the converted value
+    :param requires_type: whether the validation must be built with a type
     :return: wrapped function
     """
+    if func is None:
+        return lambda f: parameter_validation(f, transform=transform, requires_type=requires_type)
+    func_specs = inspect.getfullargspec(func)
+    func_parameters = func_specs.args + func_specs.kwonlyargs
+    pass_arg_name = "arg_name" in func_parameters
+    pass_arg_type = "arg_type" in func_parameters
+
     @wraps(func)
     def validation(parameter, arg_name: str, arg_type: type):
-        func_specs = inspect.getfullargspec(func)
-        func_parameters = func_specs.args + func_specs.kwonlyargs
         kwargs = {}
-        if "arg_name" in func_parameters:
+        if pass_arg_name:
             kwargs["arg_name"] = arg_name
-        if "arg_type" in func_parameters:
+        if pass_arg_type:
             kwargs["arg_type"] = arg_type
-        return func(parameter, **kwargs)
+        result = func(parameter, **kwargs)
+        if transform:
+            if isinstance(result, Exception):
+                return result, parameter
+            return None, result
+        if isinstance(result, Exception):
+            return result
+        return None
 
     def func_partial(arg_type: type = None):
-        nested_validation = None
-        if hasattr(arg_type, "_parameter_validation"):
+        if isinstance(arg_type, ParameterValidation):
             nested_validation = arg_type
-            arg_type = nested_validation._arg_type
-
-        def validation_partial(parameter, arg_name: str):
-            if nested_validation:
-                nested_validation(parameter, arg_name)
-            validation(parameter, arg_name, arg_type)
-
-        validation_partial._parameter_validation = True
-        validation_partial._arg_type = arg_type
-        return validation_partial
+            if requires_type:
+                _check_type(func, nested_validation._arg_type)
+            step = ("step", validation, nested_validation._arg_type)
+            return ParameterValidation(("and", nested_validation._expression, step), nested_validation._arg_type)
+        if requires_type:
+            _check_type(func, arg_type)
+        return ParameterValidation(("step", validation, arg_type), arg_type)
 
+    func_partial.__module__ = func.__module__
+    func_partial.__name__ = func.__name__
+    func_partial.__qualname__ = func.__qualname__
+    func_partial.__doc__ = func.__doc__
+    validation._factory = func_partial
+    validation._transforms = transform
     return func_partial
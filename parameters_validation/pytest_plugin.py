@@ -0,0 +1,97 @@
+"""
+Pytest plugin measuring the overhead of parameters validation per decorated function.
+
+Run pytest with `--pv-profile` to report the functions decorated with
+:meth:`validate_parameters` that spend the most time in validations, and to fail the
+run when any of them exceeds a per-call overhead budget (`--pv-max-overhead`, in
+microseconds) or a ratio of overhead against its bare call (`--pv-max-ratio`).
+Budgets can be set in the ini file as `pv_max_overhead` and `pv_max_ratio` too.
+"""
+import pytest
+
+from parameters_validation import overhead_profiler
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("parameters-validation")
+    group.addoption("--pv-profile", action="store_true", default=False,
+                    help="measure the overhead of parameters validation per decorated function")
+    group.addoption("--pv-max-overhead", type=float, default=None, metavar="MICROSECONDS",
+                    help="fail if a function's mean validation overhead per call exceeds this budget")
+    group.addoption("--pv-max-ratio", type=float, default=None, metavar="RATIO",
+                    help="fail if a function's validation overhead exceeds this ratio of its bare call")
+    group.addoption("--pv-top", type=int, default=None, metavar="N",
+                    help="number of functions to report, by total overhead (default: 10)")
+    parser.addini("pv_max_overhead", "default for --pv-max-overhead")
+    parser.addini("pv_max_ratio", "default for --pv-max-ratio")
+    parser.addini("pv_top", "default for --pv-top", default="10")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_load_initial_conftests(early_config):
+    if early_config.known_args_namespace.pv_profile:
+        overhead_profiler.enable_profiling()
+
+
+def pytest_configure(config):
+    if not config.getoption("pv_profile"):
+        return
+    config.pluginmanager.register(_OverheadReport(
+        overhead_profiler.enable_profiling(),
+        max_overhead=_get_setting(config, "pv_max_overhead"),
+        max_ratio=_get_setting(config, "pv_max_ratio"),
+        top=int(_get_setting(config, "pv_top")),
+    ), "parameters_validation_overhead")
+
+
+def pytest_unconfigure(config):
+    if config.getoption("pv_profile"):
+        overhead_profiler.disable_profiling()
+
+
+def _get_setting(config, name: str):
+    value = config.getoption(name)
+    if value is None:
+        value = config.getini(name)
+    if value in (None, ""):
+        return None
+    return float(value)
+
+
+class _OverheadReport:
+    def __init__(self, profiler: overhead_profiler.OverheadProfiler, max_overhead: float = None,
+                 max_ratio: float = None, top: int = 10):
+        self.profiler = profiler
+        self.max_overhead = max_overhead
+        self.max_ratio = max_ratio
+        self.top = top
+        self.violations = []
+
+    def _get_violations(self, results: list):
+        for result in results:
+            if self.max_overhead is not None and result.overhead_per_call > self.max_overhead * 1000:
+                yield "`{function}` validation overhead of {overhead:.2f}us per call exceeds {budget}us".format(
+                    function=result.function, overhead=result.overhead_per_call / 1000, budget=self.max_overhead)
+            if self.max_ratio is not None and result.ratio > self.max_ratio:
+                yield "`{function}` validation overhead is {ratio:.2f}x its bare call, exceeding {budget}x".format(
+                    function=result.function, ratio=result.ratio, budget=self.max_ratio)
+
+    def pytest_sessionfinish(self, session):
+        self.violations = list(self._get_violations(self.profiler.results()))
+        if self.violations and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        results = self.profiler.results()
+        terminalreporter.write_sep("-", "parameters validation overhead")
+        if not results:
+            terminalreporter.write_line("no profiled function was called")
+        else:
+            terminalreporter.write_line("{:<60} {:>10} {:>14} {:>14} {:>8}".format(
+                "function", "calls", "overhead/call", "bare/call", "ratio"))
+            for result in results[:self.top]:
+                terminalreporter.write_line("{:<60} {:>10} {:>12.2f}us {:>12.2f}us {:>7.2f}x".format(
+                    result.function, result.calls, result.overhead_per_call / 1000,
+                    result.bare_per_call / 1000, result.ratio))
+        for violation in self.violations:
+            terminalreporter.write_line("FAILED " + violation, red=True)
@@ -0,0 +1,138 @@
+import logging
+from fractions import Fraction
+from itertools import count
+from threading import Lock, current_thread, local
+
+RAISE = "raise"
+LOG = "log"
+COUNT = "count"
+
+logger = logging.getLogger("parameters_validation")
+
+_MAX_SAMPLING_DENOMINATOR = 10 ** 6
+
+
+class SamplingPolicy:
+    """
+    Policy defining which fraction of the calls to a function decorated with
+    :meth:`validate_parameters` are validated and what happens when a sampled call
+    fails validation.
+
+    Calls are sampled deterministically with a per-thread counter: with
+    `sample_rate=0.01` every 100th call of each thread is validated, starting with its
+    first one, and with `sample_rate=0.7` 7 of every 10 calls are, evenly spread. Rates
+    are approximated by the closest fraction with a denominator up to a million.
+
+    Failures are handled according to `on_failure`:
+
+    * `"raise"`: the validation error is raised (default)
+    * `"log"`: the validation error is logged to the `parameters_validation` logger
+      and the function is called anyway
+    * `"count"`: the function is called anyway
+
+    When the function is called anyway, the parameters that passed their transforming
+    validations are converted and the ones that failed are passed as they are.
+
+    Failures are counted under every policy, see `.validation_failures()` of the
+    decorated function.
+
+    :param sample_rate: fraction of calls to validate, within (0, 1]
+    :param on_failure: either `"raise"`, `"log"` or `"count"`
+    """
+    __slots__ = ("sample_rate", "on_failure")
+
+    def __init__(self, sample_rate: float = 1.0, on_failure: str = RAISE):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("`sample_rate` must be within (0, 1], got {rate}".format(rate=sample_rate))
+        if on_failure not in (RAISE, LOG, COUNT):
+            raise ValueError("`on_failure` must be one of `raise`, `log` or `count`, got `{policy}`".format(
+                policy=on_failure))
+        self.sample_rate = sample_rate
+        self.on_failure = on_failure
+
+    @property
+    def ratio(self) -> tuple:
+        ratio = Fraction(self.sample_rate).limit_denominator(_MAX_SAMPLING_DENOMINATOR)
+        if not ratio:
+            ratio = Fraction(1, _MAX_SAMPLING_DENOMINATOR)
+        return ratio.numerator, ratio.denominator
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate < 1 or self.on_failure != RAISE
+
+    def __repr__(self):
+        return "SamplingPolicy(sample_rate={rate!r}, on_failure={policy!r})".format(
+            rate=self.sample_rate, policy=self.on_failure)
+
+
+_policy = SamplingPolicy()
+
+
+def set_sampling_policy(sample_rate: float = 1.0, on_failure: str = RAISE):
+    """
+    Set the global :class:`SamplingPolicy`, used by functions decorated with
+    :meth:`validate_parameters` that don't define their own `sample_rate` nor
+    `on_failure`.
+
+    The policy is resolved when functions are decorated, so it must be set before
+    the modules defining them are imported.
+
+    >>> set_sampling_policy(sample_rate=0.01, on_failure="log")
+
+    :param sample_rate: fraction of calls to validate, within (0, 1]
+    :param on_failure: either `"raise"`, `"log"` or `"count"`
+    """
+    global _policy
+    _policy = SamplingPolicy(sample_rate, on_failure)
+
+
+def get_sampling_policy() -> SamplingPolicy:
+    """
+    :return: the global :class:`SamplingPolicy`
+    """
+    return _policy
+
+
+class _PerThreadCounter:
+    def __init__(self):
+        self._local = local()
+        self._lock = Lock()
+        self._cells = []
+        self._dead_threads_total = 0
+
+    def _get_cell(self) -> list:
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = self._local.cell = [0]
+            with self._lock:
+                self._prune()
+                self._cells.append((current_thread(), cell))
+            return cell
+
+    def _prune(self):
+        cells = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                cells.append((thread, cell))
+            else:
+                self._dead_threads_total += cell[0]
+        self._cells = cells
+
+    def increment(self) -> int:
+        cell = self._get_cell()
+        value = cell[0]
+        cell[0] = value + 1
+        return value
+
+    @property
+    def value(self) -> int:
+        with self._lock:
+            self._prune()
+            return self._dead_threads_total + sum(cell[0] for _, cell in self._cells)
+
+
+class _PerThreadCalls(local):
+    def __init__(self):
+        self.counter = count()
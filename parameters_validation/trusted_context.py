@@ -0,0 +1,64 @@
+import inspect
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from functools import wraps
+
+_trusted = ContextVar("parameters_validation_trusted", default=0)
+
+
+class _TrustedContext(ContextDecorator):
+    def __enter__(self):
+        _trusted.set(_trusted.get() + 1)
+        return self
+
+    def __exit__(self, *exc):
+        _trusted.set(_trusted.get() - 1)
+        return False
+
+    def __call__(self, func):
+        if not inspect.iscoroutinefunction(func):
+            return super().__call__(func)
+
+        @wraps(func)
+        async def trusted_coroutine(*args, **kwargs):
+            with self:
+                return await func(*args, **kwargs)
+        return trusted_coroutine
+
+
+def trusted():
+    """
+    Context manager (and decorator) to bypass every :meth:`validate_parameters`
+    validation while executing trusted code paths, i.e. code that only handles
+    values that were already validated.
+
+    >>> from parameters_validation import non_blank, validate_parameters
+    ...
+    ... @validate_parameters
+    ... def foo(s: non_blank(str)):
+    ...     pass
+    ...
+    ... with trusted():
+    ...     foo("")  # does not throw since validations are bypassed
+    ...
+    ... @trusted()
+    ... def internal_layer(s):
+    ...     foo(s)  # validations are bypassed during the whole call
+
+    The trusted state is a nesting depth stored in a :class:`contextvars.ContextVar`,
+    so it is confined to the current thread or asyncio task (and to tasks spawned from
+    it), and a single `trusted()` instance can be shared by concurrent tasks and threads.
+
+    :return: trusted context manager
+    """
+    return _TrustedContext()
+
+
+def is_trusted() -> bool:
+    """
+    Check whether the current thread or asyncio task is running inside a
+    :meth:`trusted` context.
+
+    :return: True if validations are currently bypassed
+    """
+    return _trusted.get() > 0
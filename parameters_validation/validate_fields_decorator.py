@@ -0,0 +1,302 @@
+import inspect
+from types import MemberDescriptorType
+from typing import ClassVar
+
+from parameters_validation.parameter_validation_decorator import ParameterValidation
+
+try:
+    import dataclasses
+except ImportError:
+    dataclasses = None
+
+_MISSING = object()
+
+
+def _is_validation(annotation) -> bool:
+    return hasattr(annotation, "_parameter_validation")
+
+
+def _get_class_annotations(cls) -> dict:
+    annotations = {}
+    for klass in reversed(cls.__mro__):
+        for name, annotation in klass.__dict__.get("__annotations__", {}).items():
+            if annotation is ClassVar or getattr(annotation, "__origin__", None) is ClassVar:
+                continue
+            annotations[name] = annotation
+    return annotations
+
+
+def _get_class_default(cls, name: str):
+    default = getattr(cls, name, _MISSING)
+    if isinstance(default, MemberDescriptorType):
+        return _MISSING
+    return default
+
+
+def _get_fields_signature(cls, annotations: dict) -> inspect.Signature:
+    parameters = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    for name in annotations:
+        default = _get_class_default(cls, name)
+        parameters.append(inspect.Parameter(
+            name,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            default=inspect.Parameter.empty if default is _MISSING else default,
+        ))
+    try:
+        return inspect.Signature(parameters)
+    except ValueError as e:
+        raise TypeError("Unable to generate `{cls}.__init__`: {error}".format(cls=cls.__qualname__, error=e))
+
+
+def _is_dataclass(cls) -> bool:
+    return dataclasses is not None and dataclasses.is_dataclass(cls)
+
+
+def _get_factory_fields(cls) -> set:
+    if not _is_dataclass(cls):
+        return set()
+    return {field.name for field in dataclasses.fields(cls) if field.default_factory is not dataclasses.MISSING}
+
+
+def _transforms(validation) -> bool:
+    return isinstance(validation, ParameterValidation) and validation._transforms
+
+
+def _render_default(namespace: dict, parameter: inspect.Parameter, validation, converted_defaults: dict) -> str:
+    name = parameter.name
+    if parameter.default is inspect.Parameter.empty:
+        return name
+    namespace["_default_" + name] = converted_defaults.get(name, parameter.default)
+    if validation is None:
+        return "{n}=_default_{n}".format(n=name)
+    return "{n}=_MISSING".format(n=name)
+
+
+def _render_check(name: str, transforms: bool) -> str:
+    validate = "_validation_{n}({n}, {n!r})".format(n=name)
+    if transforms:
+        return "{n} = {validate}".format(n=name, validate=validate)
+    return validate
+
+
+def _render_validation(parameter: inspect.Parameter, factory_field: bool, transforms: bool) -> tuple:
+    name = parameter.name
+    validate = _render_check(name, transforms)
+    validate_after_init = "_validation_{n}(self.{n}, {n!r})".format(n=name)
+    if transforms:
+        validate_after_init = "_object_setattr(self, {n!r}, {validate})".format(n=name, validate=validate_after_init)
+    if parameter.default is inspect.Parameter.empty:
+        return ["    " + validate], []
+    if not factory_field:
+        return [
+            "    if {n} is _MISSING:".format(n=name),
+            "        {n} = _default_{n}".format(n=name),
+            "    else:",
+            "        " + validate,
+        ], []
+    return [
+        "    _{n}_from_factory = {n} is _MISSING".format(n=name),
+        "    if _{n}_from_factory:".format(n=name),
+        "        {n} = _default_{n}".format(n=name),
+        "    else:",
+        "        " + validate,
+    ], [
+        "    if _{n}_from_factory:".format(n=name),
+        "        " + validate_after_init,
+    ]
+
+
+def _render_dataclass_assignments(cls, namespace: dict, parameters: list, dataclass_fields: tuple) -> list:
+    lines = []
+    for field in dataclass_fields:
+        name = field.name
+        if field.init:
+            lines.append("    _setattr(self, {n!r}, {n})".format(n=name))
+        elif field.default is not dataclasses.MISSING:
+            namespace["_default_" + name] = field.default
+            lines.append("    _setattr(self, {n!r}, _default_{n})".format(n=name))
+        elif field.default_factory is not dataclasses.MISSING:
+            namespace["_factory_" + name] = field.default_factory
+            lines.append("    _setattr(self, {n!r}, _factory_{n}())".format(n=name))
+    if hasattr(cls, "__post_init__"):
+        field_names = {field.name for field in dataclass_fields}
+        init_vars = [parameter.name for parameter in parameters if parameter.name not in field_names]
+        lines.append("    self.__post_init__({init_vars})".format(init_vars=", ".join(init_vars)))
+    return lines
+
+
+def _has_init(cls) -> bool:
+    for klass in cls.__mro__[:-1]:
+        init = klass.__dict__.get("__init__")
+        if init is not None:
+            return not getattr(init, "_fields_init", False)
+    return False
+
+
+def _build_init(cls, signature: inspect.Signature, validations: dict, factory_fields: set, converted_defaults: dict,
+                setattr_func):
+    namespace = {
+        "_MISSING": _MISSING,
+        "_setattr": setattr_func,
+        "_object_setattr": object.__setattr__,
+        "_init": cls.__init__,
+    }
+    arguments = ["self"]
+    call_arguments = ["self"]
+    body = []
+    after_init = []
+    kinds = inspect.Parameter
+    parameters = list(signature.parameters.values())[1:]
+    dataclass_fields = dataclasses.fields(cls) if setattr_func is not None and _is_dataclass(cls) else None
+    for index, parameter in enumerate(parameters):
+        name = parameter.name
+        validation = validations.get(name)
+        if dataclass_fields is not None and name in factory_fields:
+            namespace["_factory_" + name] = cls.__dataclass_fields__[name].default_factory
+            arguments.append("{n}=_MISSING".format(n=name))
+            body.extend([
+                "    if {n} is _MISSING:".format(n=name),
+                "        {n} = _factory_{n}()".format(n=name),
+            ])
+            if validation is not None:
+                namespace["_validation_" + name] = validation
+                body.append("    " + _render_check(name, _transforms(validation)))
+            continue
+        if parameter.kind is kinds.VAR_POSITIONAL:
+            arguments.append("*" + name)
+            call_arguments.append("*" + name)
+            continue
+        if parameter.kind is kinds.VAR_KEYWORD:
+            arguments.append("**" + name)
+            call_arguments.append("**" + name)
+            continue
+        if parameter.kind is kinds.KEYWORD_ONLY and "*" not in arguments and not any(
+                p.kind is kinds.VAR_POSITIONAL for p in parameters[:index]):
+            arguments.append("*")
+        arguments.append(_render_default(namespace, parameter, validation, converted_defaults))
+        if parameter.kind is kinds.KEYWORD_ONLY:
+            call_arguments.append("{n}={n}".format(n=name))
+        else:
+            call_arguments.append(name)
+        if parameter.kind is kinds.POSITIONAL_ONLY and (
+                index + 1 == len(parameters) or parameters[index + 1].kind is not kinds.POSITIONAL_ONLY):
+            arguments.append("/")
+        if validation is not None:
+            namespace["_validation_" + name] = validation
+            validate, validate_after_init = _render_validation(
+                parameter, name in factory_fields, _transforms(validation))
+            body.extend(validate)
+            after_init.extend(validate_after_init)
+    if setattr_func is None:
+        body.append("    _init({arguments})".format(arguments=", ".join(call_arguments)))
+    elif dataclass_fields is None:
+        body.extend("    _setattr(self, {n!r}, {n})".format(n=parameter.name) for parameter in parameters)
+    else:
+        body.extend(_render_dataclass_assignments(cls, namespace, parameters, dataclass_fields))
+    body.extend(after_init)
+    source = "def __init__({arguments}):\n{body}\n".format(
+        arguments=", ".join(arguments),
+        body="\n".join(body or ["    pass"]),
+    )
+    exec(source, namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = "{cls}.__init__".format(cls=cls.__qualname__)
+    init.__module__ = cls.__module__
+    init.__doc__ = getattr(cls.__init__, "__doc__", None)
+    init.__signature__ = signature
+    return init
+
+
+def _build_setattr(cls, validations: dict, base_setattr):
+    transforming = {name for name, validation in validations.items() if _transforms(validation)}
+
+    def __setattr__(self, name, value):
+        validation = validations.get(name)
+        if validation is not None:
+            converted = validation(value, name)
+            if name in transforming:
+                value = converted
+        base_setattr(self, name, value)
+
+    __setattr__.__qualname__ = "{cls}.__setattr__".format(cls=cls.__qualname__)
+    __setattr__.__module__ = cls.__module__
+    return __setattr__
+
+
+def _validate_defaults(signature: inspect.Signature, validations: dict, factory_fields: set) -> dict:
+    converted_defaults = {}
+    for name, validation in validations.items():
+        parameter = signature.parameters.get(name)
+        if parameter is None or parameter.default is inspect.Parameter.empty or name in factory_fields:
+            continue
+        value = validation(parameter.default, name)
+        if _transforms(validation):
+            converted_defaults[name] = value
+    return converted_defaults
+
+
+def validate_fields(cls=None, *, validate_assignment: bool = False):
+    """
+    Class decorator to apply validations in the fields type hints of dataclasses and
+    plain annotated classes whenever an instance is constructed.
+
+    >>> from dataclasses import dataclass
+    ... from parameters_validation import non_blank, non_negative
+    ...
+    ... @validate_fields
+    ... @dataclass(slots=True)
+    ... class User:
+    ...     name: non_blank(str)
+    ...     age: non_negative(int) = 0
+    ...
+    ... User("John")   # valid
+    ... User(" ")      # invalid, blank name
+    ... User("Joe", -1)  # invalid, negative age
+
+    An `__init__` with the validations inlined is generated from the class' fields.
+    When the class already has or inherits an `__init__` (e.g. generated by
+    `@dataclass`), the generated one validates its arguments and delegates to it. Like in
+    :meth:`validate_parameters`, default values are validated once at decoration time,
+    and fields annotated with transforming validations (see :meth:`parameter_validation`)
+    are stored converted.
+
+    With `validate_assignment=True` a `__setattr__` validating assignments to
+    validated fields is generated too:
+
+    >>> @validate_fields(validate_assignment=True)
+    ... class Point:
+    ...     x: non_negative(int)
+    ...     y: non_negative(int)
+    ...
+    ... point = Point(1, 2)
+    ... point.x = -1  # invalid, negative x
+
+    :param cls: decorated class
+    :param validate_assignment: whether to also validate assignments to fields
+    :return: the decorated class
+    """
+    if cls is None:
+        return lambda klass: validate_fields(klass, validate_assignment=validate_assignment)
+
+    annotations = _get_class_annotations(cls)
+    validations = {name: annotation for name, annotation in annotations.items() if _is_validation(annotation)}
+    factory_fields = _get_factory_fields(cls)
+    frozen = _is_dataclass(cls) and cls.__dataclass_params__.frozen
+    base_setattr = cls.__setattr__
+    delegate = _is_dataclass(cls) or _has_init(cls)
+    inline_dataclass_init = _is_dataclass(cls) and cls.__dataclass_params__.init and validate_assignment and not frozen
+
+    if delegate:
+        signature = inspect.signature(cls.__init__)
+    else:
+        signature = _get_fields_signature(cls, annotations)
+    converted_defaults = _validate_defaults(signature, validations, factory_fields)
+
+    if not delegate or inline_dataclass_init:
+        cls.__init__ = _build_init(cls, signature, validations, factory_fields, converted_defaults, base_setattr)
+        cls.__init__._fields_init = not delegate
+    elif frozen or not validate_assignment:
+        cls.__init__ = _build_init(cls, signature, validations, factory_fields, converted_defaults, None)
+    if validate_assignment and not frozen:
+        cls.__setattr__ = _build_setattr(cls, validations, base_setattr)
+    return cls
@@ -2,55 +2,273 @@ import inspect
 from copy import deepcopy
 from functools import wraps
 
+from parameters_validation import failure_log, overhead_profiler, sampling_policy
+from parameters_validation.exceptions import ParametersValidationError
+from parameters_validation.parameter_validation_decorator import ParameterValidation
+from parameters_validation.sampling_policy import SamplingPolicy, RAISE, LOG, logger, _PerThreadCounter, \
+    _PerThreadCalls
+from parameters_validation.trusted_context import _trusted
+from parameters_validation.validation_result import ValidationResult, VALID
 
-def _get_parameter_value_dict(specs, args, kwargs):
-    parameters = kwargs.copy()
-    for arg_value, parameter in zip(args, specs.args):
-        parameters[parameter] = arg_value
+
+def _get_default_value_dict(specs):
+    defaults = {}
     if specs.defaults:
-        for default_parameter, default_value in zip(
-                specs.args[len(specs.args) - len(specs.defaults):], specs.defaults
-        ):
-            if default_parameter in parameters:
-                continue
-            parameters[default_parameter] = default_value
+        defaults.update(zip(specs.args[len(specs.args) - len(specs.defaults):], specs.defaults))
     if specs.kwonlydefaults:
-        for default_parameter, default_value in specs.kwonlydefaults.items():
-            if default_parameter in parameters:
-                continue
-            parameters[default_parameter] = default_value
-    return parameters
+        defaults.update(specs.kwonlydefaults)
+    return defaults
+
+
+def _get_validation_plan(specs, validations: dict):
+    positions = {parameter: position for position, parameter in enumerate(specs.args)}
+    plan = []
+    for parameter, annotation in validations.items():
+        if not hasattr(annotation, "_parameter_validation"):
+            continue
+        if parameter not in positions and parameter not in specs.kwonlyargs:
+            raise KeyError(parameter)
+        transforms = isinstance(annotation, ParameterValidation) and annotation._transforms
+        plan.append((parameter, positions.get(parameter), annotation, transforms))
+    return tuple(plan)
+
+
+def _get_supplied_parameters(plan, args, kwargs):
+    for parameter, position, annotation, _ in plan:
+        if position is not None and position < len(args):
+            yield parameter, args[position], annotation
+        elif parameter in kwargs:
+            yield parameter, kwargs[parameter], annotation
+
+
+def _validate_defaults(specs, plan) -> dict:
+    defaults = _get_default_value_dict(specs)
+    converted_defaults = {}
+    for parameter, _, annotation, transforms in plan:
+        if parameter in defaults:
+            value = annotation(defaults[parameter], parameter)
+            if transforms:
+                converted_defaults[parameter] = value
+    return converted_defaults
+
+
+def _check(annotation, value, arg_name: str) -> ValidationResult:
+    if hasattr(annotation, "check"):
+        return annotation.check(value, arg_name)
+    try:
+        annotation(value, arg_name)
+    except Exception as e:
+        return ValidationResult(arg_name, e.with_traceback(None))
+    return VALID
+
+
+def _record_failure(f: callable, parameter: str, position: int, annotation, args: tuple, kwargs: dict,
+                    error: Exception):
+    if failure_log._failure_log is None:
+        return
+    value = args[position] if position is not None and position < len(args) else kwargs.get(parameter)
+    failure_log._failure_log.record(f, parameter, annotation, value, error)
+
 
+def _convert(conversions: tuple, converted_defaults: dict, args: tuple, kwargs: dict) -> tuple:
+    converted_args = None
+    for parameter, position, annotation, _ in conversions:
+        if position is not None and position < len(args):
+            if converted_args is None:
+                converted_args = list(args)
+            converted_args[position] = annotation(args[position], parameter)
+        elif parameter in kwargs:
+            kwargs[parameter] = annotation(kwargs[parameter], parameter)
+        elif parameter in converted_defaults:
+            kwargs[parameter] = converted_defaults[parameter]
+    if converted_args is not None:
+        args = converted_args
+    return args, kwargs
 
-def _get_wrapper(f: callable, specs: inspect.FullArgSpec, validations: dict = None):
+
+def _check_parameters(f: callable, plan: tuple, converted_defaults: dict, args: tuple, kwargs: dict,
+                      collect_errors: bool, exhaustive: bool = False) -> tuple:
+    failures = None
+    converted_args = None
+    converted_kwargs = None
+    for parameter, position, annotation, transforms in plan:
+        if position is not None and position < len(args):
+            value = args[position]
+        elif parameter in kwargs:
+            value = kwargs[parameter]
+        else:
+            if parameter in converted_defaults:
+                if converted_kwargs is None:
+                    converted_kwargs = dict(kwargs)
+                converted_kwargs[parameter] = converted_defaults[parameter]
+            continue
+        result = _check(annotation, value, parameter)
+        if not result:
+            if failure_log._failure_log is not None:
+                failure_log._failure_log.record(f, parameter, annotation, value, result.error)
+            if not (collect_errors or exhaustive):
+                return result.error, args, kwargs
+            if failures is None:
+                failures = []
+            failures.append((parameter, value, result.error))
+        elif not transforms:
+            continue
+        elif position is not None and position < len(args):
+            if converted_args is None:
+                converted_args = list(args)
+            converted_args[position] = result.value
+        else:
+            if converted_kwargs is None:
+                converted_kwargs = dict(kwargs)
+            converted_kwargs[parameter] = result.value
+    if converted_args is not None:
+        args = converted_args
+    if converted_kwargs is not None:
+        kwargs = converted_kwargs
+    if failures is not None:
+        error = ParametersValidationError(f.__qualname__, failures) if collect_errors else failures[0][2]
+        return error, args, kwargs
+    return None, args, kwargs
+
+
+def _get_wrapper(
+        f: callable,
+        specs: inspect.FullArgSpec,
+        validations: dict = None,
+        policy: SamplingPolicy = None,
+        collect_errors: bool = False,
+        converted_defaults: dict = None,
+):
     if validations is None:
         validations = specs.annotations
+    if policy is None:
+        policy = sampling_policy.get_sampling_policy()
+    if converted_defaults is None:
+        converted_defaults = {}
+    plan = _get_validation_plan(specs, validations)
+    conversions = tuple(entry for entry in plan if entry[3])
+    failures = None
+    profiler = overhead_profiler.get_profiler()
+    call = f if profiler is None else profiler.time_call(f)
+
+    def check_args(*args, **kwargs) -> ValidationResult:
+        for parameter, value, annotation in _get_supplied_parameters(plan, args, kwargs):
+            result = _check(annotation, value, parameter)
+            if not result:
+                return result
+        return VALID
+
+    if policy.enabled:
+        sampled, period = policy.ratio
+        exhaustive = policy.on_failure != RAISE
+        calls = _PerThreadCalls()
+        failures = _PerThreadCounter()
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            if next(calls.counter) * sampled % period >= sampled or _trusted.get():
+                if conversions:
+                    args, kwargs = _convert(conversions, converted_defaults, args, kwargs)
+                return call(*args, **kwargs)
+            error, args, kwargs = _check_parameters(
+                wrapper, plan, converted_defaults, args, kwargs, collect_errors, exhaustive)
+            if error is not None:
+                failures.increment()
+                if policy.on_failure == RAISE:
+                    raise error
+                if policy.on_failure == LOG:
+                    logger.warning("Sampled validation of `%s` failed: %s", f.__qualname__, error)
+            return call(*args, **kwargs)
+    elif collect_errors:
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            if _trusted.get():
+                if conversions:
+                    args, kwargs = _convert(conversions, converted_defaults, args, kwargs)
+                return call(*args, **kwargs)
+            error, args, kwargs = _check_parameters(wrapper, plan, converted_defaults, args, kwargs, collect_errors)
+            if error is not None:
+                raise error
+            return call(*args, **kwargs)
+    elif conversions:
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            if _trusted.get():
+                args, kwargs = _convert(conversions, converted_defaults, args, kwargs)
+                return call(*args, **kwargs)
+            converted_args = None
+            try:
+                for parameter, position, annotation, transforming in plan:
+                    if position is not None and position < len(args):
+                        value = annotation(args[position], parameter)
+                        if transforming:
+                            if converted_args is None:
+                                converted_args = list(args)
+                            converted_args[position] = value
+                    elif parameter in kwargs:
+                        value = annotation(kwargs[parameter], parameter)
+                        if transforming:
+                            kwargs[parameter] = value
+                    elif parameter in converted_defaults:
+                        kwargs[parameter] = converted_defaults[parameter]
+            except Exception as e:
+                _record_failure(wrapper, parameter, position, annotation, args, kwargs, e)
+                raise
+            if converted_args is not None:
+                args = converted_args
+            return call(*args, **kwargs)
+    else:
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            if _trusted.get():
+                return call(*args, **kwargs)
+            try:
+                for parameter, position, annotation, _ in plan:
+                    if position is not None and position < len(args):
+                        annotation(args[position], parameter)
+                    elif parameter in kwargs:
+                        annotation(kwargs[parameter], parameter)
+            except Exception as e:
+                _record_failure(wrapper, parameter, position, annotation, args, kwargs, e)
+                raise
 
-    @wraps(f)
-    def wrapper(*args, **kwargs):
-        parameters = _get_parameter_value_dict(specs, args, kwargs)
-        for parameter, annotation in validations.items():
-            if not hasattr(annotation, "_parameter_validation"):
-                continue
-            annotation(parameters[parameter], parameter)
+            return call(*args, **kwargs)
 
-        return f(*args, **kwargs)
+    if profiler is not None:
+        wrapper = profiler.time_wrapper(f, wrapper)
 
     def parameter_validation_mock(pseudo_validation_function: callable):
         mock = deepcopy(pseudo_validation_function)
-        mock._parameter_validation = True
+        if not hasattr(mock, "_parameter_validation"):
+            mock._parameter_validation = True
         return mock
 
     def mock_validations(mocks: dict):
         valid_mocks = {p: parameter_validation_mock(v) for p, v in mocks.items()}
-        return _get_wrapper(f, specs, {**validations, **valid_mocks})
+        return _get_wrapper(f, specs, {**validations, **valid_mocks}, policy, collect_errors, converted_defaults)
     wrapper.mock_validations = mock_validations
-    wrapper.skip_validations = lambda: f
+    wrapper.check_args = check_args
+    wrapper.validation_failures = lambda: 0 if failures is None else failures.value
+    if conversions:
+        @wraps(f)
+        def skipping(*args, **kwargs):
+            args, kwargs = _convert(conversions, converted_defaults, args, kwargs)
+            return f(*args, **kwargs)
+        wrapper.skip_validations = lambda: skipping
+    else:
+        wrapper.skip_validations = lambda: f
+    wrapper.recent_failures = lambda: failure_log.get_recent_failures(wrapper)
 
     return wrapper
 
 
-def validate_parameters(func):
+def validate_parameters(
+        func: callable = None,
+        *,
+        sample_rate: float = None,
+        on_failure: str = None,
+        collect_errors: bool = False,
+):
     """
     Decorator to apply validations in the parameters type hints before executing the
     decorated function.
@@ -86,8 +304,90 @@ def validate_parameters(func):
     ...
     ... foo.mock_validations({"s": lambda *_: print("mocked")})("")  # prints "mocked"
 
+    Validations are bypassed altogether inside a :meth:`trusted` context:
+
+    >>> from parameters_validation import trusted
+    ...
+    ... with trusted():
+    ...     foo("")  # does not throw since validations are bypassed
+
+    Validations can be checked without calling the function nor raising exceptions
+    with `.check_args(...)`, which returns a :class:`ValidationResult`:
+
+    >>> from parameters_validation import non_blank
+    ...
+    ... @validate_parameters
+    ... def foo(s: non_blank(str)):
+    ...     pass
+    ...
+    ... if not foo.check_args(""):
+    ...     print("invalid")
+
+    Default values are validated once, when the function is decorated, so an invalid
+    default fails at function definition time and calls that rely on a default value
+    skip its validation.
+
+    Parameters annotated with transforming validations (see
+    :meth:`parameter_validation`) are passed to the decorated function converted. Their
+    annotations run on every call, even in calls that bypass validations (trusted,
+    unsampled or skipped calls), so the decorated function always receives converted
+    values; only the validations of the other parameters are bypassed:
+
+    >>> from parameters_validation import as_int, non_negative
+    ...
+    ... @validate_parameters
+    ... def foo(page: non_negative(as_int(str)) = "0"):
+    ...     return page + 1
+    ...
+    ... foo("41")  # 42
+    ... foo()      # 1
+
+    Functions too hot to be validated on every call can validate just a sample of the
+    calls (see :class:`SamplingPolicy`), while the remaining calls go straight to the
+    decorated function:
+
+    >>> @validate_parameters(sample_rate=0.01, on_failure="log")
+    ... def foo(s: non_blank(str)):
+    ...     pass
+    ...
+    ... foo("")  # first call is validated: logs the failure and calls foo anyway
+    ... foo.validation_failures()  # 1
+
+    When neither `sample_rate` nor `on_failure` are given, the global policy set with
+    :meth:`set_sampling_policy` is used, which by default validates every call and
+    raises on failure.
+
+    By default validation stops at the first invalid parameter. With
+    `collect_errors=True` every parameter is validated and a single
+    :class:`ParametersValidationError` listing all failures is raised:
+
+    >>> @validate_parameters(collect_errors=True)
+    ... def foo(a: non_blank(str), b: non_blank(str)):
+    ...     pass
+    ...
+    ... foo("", " ")  # raises ParametersValidationError for both `a` and `b`
+
+    Once enabled with :meth:`enable_failure_log`, the most recent validation failures
+    are kept for diagnostics and returned by `.recent_failures()`:
+
+    >>> from parameters_validation import enable_failure_log
+    ...
+    ... enable_failure_log()
+    ... foo("", " ")  # raises, recording a failure of both `a` and `b`
+    ... foo.recent_failures()  # [FailureRecord(function='module.foo', parameter='a', ...), ...]
+
     :param func: decorated function
+    :param sample_rate: fraction of calls to validate, within (0, 1]
+    :param on_failure: either `"raise"`, `"log"` or `"count"`
+    :param collect_errors: whether to validate every parameter and raise an aggregated error
     :return: wrapped function
     """
+    if func is None:
+        return lambda f: validate_parameters(
+            f, sample_rate=sample_rate, on_failure=on_failure, collect_errors=collect_errors)
+    policy = None
+    if sample_rate is not None or on_failure is not None:
+        policy = SamplingPolicy(1.0 if sample_rate is None else sample_rate, on_failure or RAISE)
     specs = inspect.getfullargspec(func)
-    return _get_wrapper(func, specs)
+    converted_defaults = _validate_defaults(specs, _get_validation_plan(specs, specs.annotations))
+    return _get_wrapper(func, specs, policy=policy, collect_errors=collect_errors, converted_defaults=converted_defaults)
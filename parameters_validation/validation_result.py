@@ -0,0 +1,38 @@
+class ValidationResult:
+    """
+    Outcome of a non-raising validation check, as returned by the `.check` method of
+    validations and the `.check_args` method of functions decorated with
+    :meth:`validate_parameters`.
+
+    A result is truthy when validation succeeded. When it failed, `arg_name` and
+    `error` describe the failure; `error` is the exception that validation would have
+    raised, created without a traceback. Successful results of transforming
+    validations hold the converted `value`.
+
+    >>> from parameters_validation import non_blank
+    ...
+    ... result = non_blank(str).check("", "name")
+    ... if not result:
+    ...     print(result.arg_name, result.error)
+    """
+    __slots__ = ("arg_name", "error", "value")
+
+    def __init__(self, arg_name: str = None, error: Exception = None, value=None):
+        self.arg_name = arg_name
+        self.error = error
+        self.value = value
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __bool__(self):
+        return self.error is None
+
+    def __repr__(self):
+        if self.error is None:
+            return "ValidationResult(ok)"
+        return "ValidationResult(arg_name={n!r}, error={e!r})".format(n=self.arg_name, e=self.error)
+
+
+VALID = ValidationResult()
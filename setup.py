@@ -1,5 +1,9 @@
 from setuptools import setup
 
+install_deps = [
+    'contextvars;python_version<"3.7"',
+]
+
 setup_deps = [
     'pytest-runner',
 ]
@@ -26,9 +30,13 @@ setup(
     keywords=('validation parameter parameters param params'
               ' validate check argument arguments arg args'
               ' type hint'),
+    install_requires=install_deps,
     setup_requires=setup_deps,
     tests_require=test_deps,
     extras_require=extras,
+    entry_points={
+        'pytest11': ['parameters_validation = parameters_validation.pytest_plugin'],
+    },
     classifiers=[
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
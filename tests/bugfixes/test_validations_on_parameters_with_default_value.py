@@ -7,6 +7,9 @@ value are always applied to the default value and not to explicit
 passed values.
 
 This bug was fixed in version 1.1.4
+
+Since default values are validated once at function definition time, a
+bad default value now fails when the function is decorated
 """
 import pytest
 
@@ -32,13 +35,11 @@ class TestValidationsOnParameterWithDefaultValue:
         # given
         default_value = "default value"
 
-        @validate_parameters
-        def guinea_pig(s: no_whitespaces(non_blank(str)) = default_value):
-            return s
-
         # then
         with pytest.raises(ValueError):
-            guinea_pig()
+            @validate_parameters
+            def guinea_pig(s: no_whitespaces(non_blank(str)) = default_value):
+                return s
 
     def test_custom_value_success(self):
         # given
@@ -16,11 +16,6 @@ def foo(
     return a, b, c, d, e, f
 
 
-@validate_parameters
-def bar(a: strongly_typed()):
-    return a
-
-
 class TestBuiltinValidations:
     def test_success(self):
         foo("non-blank", "", [None], "", 42, [1])
@@ -49,9 +44,19 @@ class TestBuiltinValidations:
         with pytest.raises(TypeError):
             foo("non-blank", "", [None], "", 42, 7)
 
-    def test_strongly_typed_incorrect_usage(self):
-        with pytest.raises(RuntimeError):
-            bar("")
+    def test_strongly_typed_incorrect_usage_fails_at_definition_time(self):
+        with pytest.raises(TypeError):
+            @validate_parameters
+            def bar(a: strongly_typed()):
+                return a
+        for arg_type in ("str", 1, List[int], non_null()):
+            with pytest.raises(TypeError):
+                strongly_typed(arg_type)
+
+    def test_strongly_typed_accepts_isinstance_types(self):
+        for arg_type, value in ((int, 1), ((int, str), ""), (int | None, None), (List, [])):
+            assert strongly_typed(arg_type).check(value, "a")
+        assert strongly_typed(non_blank(str)).check("a", "a")
 
     def test_unable_to_validate_non_blank(self):
         with pytest.raises(RuntimeError):
@@ -0,0 +1,68 @@
+from parameters_validation import validate_parameters, parameter_validation, \
+    non_blank, no_whitespaces, non_empty, strongly_typed
+
+
+@parameter_validation
+def raising_validation(param, arg_name):
+    if param:
+        raise ValueError("`{n}` must be falsy".format(n=arg_name))
+
+
+@validate_parameters
+def foo(a: non_blank(str), b: no_whitespaces(non_empty(str)), c: raising_validation(int) = 0):
+    raise AssertionError("checks must not call the decorated function")
+
+
+class TestValidationCheck:
+    def test_success(self):
+        result = non_blank(str).check("name", "arg")
+        assert result
+        assert result.ok
+        assert result.error is None
+
+    def test_failure(self):
+        result = non_blank(str).check(" ", "arg")
+        assert not result
+        assert result.arg_name == "arg"
+        assert isinstance(result.error, ValueError)
+        assert result.error.__traceback__ is None
+
+    def test_unable_to_validate(self):
+        result = non_empty(str).check(None, "arg")
+        assert isinstance(result.error, RuntimeError)
+
+    def test_nested_failure(self):
+        assert isinstance(no_whitespaces(non_empty(str)).check("", "arg").error, ValueError)
+        assert isinstance(no_whitespaces(non_empty(str)).check("a b", "arg").error, ValueError)
+
+    def test_strongly_typed(self):
+        assert strongly_typed(str).check("", "arg")
+        assert isinstance(strongly_typed(str).check(1, "arg").error, TypeError)
+
+    def test_raising_custom_validation(self):
+        result = raising_validation(int).check(1, "arg")
+        assert isinstance(result.error, ValueError)
+        assert result.error.__traceback__ is None
+
+
+class TestValidateParametersCheckArgs:
+    def test_success(self):
+        assert foo.check_args("a", "b")
+        assert foo.check_args("a", b="b", c=0)
+
+    def test_failure(self):
+        result = foo.check_args("a", "b c")
+        assert not result
+        assert result.arg_name == "b"
+        assert isinstance(result.error, ValueError)
+
+    def test_custom_validation_failure(self):
+        result = foo.check_args("a", "b", c=1)
+        assert result.arg_name == "c"
+
+    def test_mocked_validations(self):
+        def mock(*_):
+            raise TypeError
+
+        result = foo.mock_validations({"a": mock}).check_args("a", "b")
+        assert isinstance(result.error, TypeError)
@@ -0,0 +1,89 @@
+import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from parameters_validation import validate_parameters, parameter_validation, non_blank, \
+    non_negative, non_null, strongly_typed, ParametersValidationError
+
+
+@parameter_validation
+def raising_validation(param, arg_name):
+    if param:
+        raise ValueError("`{n}` must be falsy".format(n=arg_name))
+
+
+@validate_parameters(collect_errors=True)
+def register(name: non_blank(str), age: non_negative(int), *, tags: ~non_null() | strongly_typed(list) = None, flag: raising_validation(bool) = False):
+    return name, age, tags
+
+
+class TestCollectErrors:
+    def test_success(self):
+        assert register("John", 42, tags=[]) == ("John", 42, [])
+
+    def test_all_failures_are_reported(self):
+        with pytest.raises(ParametersValidationError) as e:
+            register("", -1, tags="tag", flag=True)
+        assert e.value.parameters == ("name", "age", "tags", "flag")
+        assert [type(error) for _, _, error in e.value.failures] == [ValueError, ValueError, TypeError, ValueError]
+        assert [value for _, value, _ in e.value.failures] == ["", -1, "tag", True]
+
+    def test_single_failure(self):
+        with pytest.raises(ParametersValidationError) as e:
+            register("John", -1)
+        assert e.value.parameters == ("age",)
+
+    def test_is_value_error(self):
+        with pytest.raises(ValueError):
+            register("", 42)
+
+    def test_failures_have_no_tracebacks(self):
+        with pytest.raises(ParametersValidationError) as e:
+            register("", 42, flag=True)
+        assert all(error.__traceback__ is None for _, _, error in e.value.failures)
+
+    def test_to_dict_is_serializable(self):
+        with pytest.raises(ParametersValidationError) as e:
+            register("x" * 1000, -1, tags=object())
+        payload = e.value.to_dict()
+        assert json.loads(json.dumps(payload)) == payload
+        assert [error["parameter"] for error in payload["errors"]] == ["age", "tags"]
+        assert payload["errors"][0] == {
+            "parameter": "age",
+            "value": "-1",
+            "type": "ValueError",
+            "message": "Parameter `age <int>` cannot be negative",
+        }
+
+    def test_value_repr_is_truncated(self):
+        with pytest.raises(ParametersValidationError) as e:
+            register(" " * 1000, 42)
+        assert len(e.value.to_dict()["errors"][0]["value"]) == 80
+
+    def test_sampled_collect_errors(self):
+        @validate_parameters(sample_rate=0.5, collect_errors=True)
+        def foo(a: non_blank(str), b: non_blank(str)):
+            return a, b
+
+        with pytest.raises(ParametersValidationError) as e:
+            foo("", "")
+        assert e.value.parameters == ("a", "b")
+        assert foo("", "") == ("", "")
+
+    def test_error_can_be_pickled(self):
+        with pytest.raises(ParametersValidationError) as e:
+            register("", -1)
+        error = pickle.loads(pickle.dumps(e.value))
+        assert error.function == e.value.function
+        assert error.parameters == ("name", "age")
+        assert str(error) == str(e.value)
+        assert error.to_dict() == e.value.to_dict()
+
+    def test_error_is_raised_from_process_pool(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(register, "", -1)
+            with pytest.raises(ParametersValidationError) as e:
+                future.result()
+        assert e.value.parameters == ("name", "age")
@@ -0,0 +1,95 @@
+import threading
+
+from parameters_validation import validate_parameters, parameter_validation, non_blank
+from parameters_validation.sampling_policy import _PerThreadCounter
+
+THREADS = 8
+CALLS = 200
+
+
+def run_in_threads(target):
+    barrier = threading.Barrier(THREADS)
+
+    def work():
+        barrier.wait()
+        target()
+
+    workers = [threading.Thread(target=work) for _ in range(THREADS)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+class TestConcurrentValidations:
+    def test_per_thread_counter_totals(self):
+        counter = _PerThreadCounter()
+
+        def work():
+            for _ in range(CALLS):
+                counter.increment()
+
+        run_in_threads(work)
+        assert counter.value == THREADS * CALLS
+
+    def test_per_thread_counter_drops_cells_of_dead_threads(self):
+        counter = _PerThreadCounter()
+
+        def work():
+            for _ in range(CALLS):
+                counter.increment()
+
+        for _ in range(3):
+            run_in_threads(work)
+        counter.increment()
+        assert len(counter._cells) == 1
+        assert counter.value == 3 * THREADS * CALLS + 1
+
+    def test_failures_are_counted_across_threads(self):
+        @validate_parameters(on_failure="count")
+        def foo(a: non_blank(str)):
+            return a
+
+        def work():
+            for _ in range(CALLS):
+                foo("")
+
+        run_in_threads(work)
+        assert foo.validation_failures() == THREADS * CALLS
+
+    def test_calls_are_sampled_per_thread(self):
+        sampled = []
+        lock = threading.Lock()
+
+        @parameter_validation
+        def record(param, arg_name):
+            with lock:
+                sampled.append(param)
+
+        @validate_parameters(sample_rate=0.1)
+        def foo(a: record(int)):
+            return a
+
+        def work():
+            for index in range(CALLS):
+                foo(index)
+
+        run_in_threads(work)
+        assert sorted(sampled) == sorted(list(range(0, CALLS, 10)) * THREADS)
+
+    def test_validations_from_many_threads(self):
+        errors = []
+
+        @validate_parameters
+        def foo(a: non_blank(str)):
+            return a
+
+        def work():
+            for index in range(CALLS):
+                try:
+                    foo(" " if index % 2 else "a")
+                except ValueError as e:
+                    errors.append(e)
+
+        run_in_threads(work)
+        assert len(errors) == THREADS * CALLS // 2
@@ -0,0 +1,50 @@
+import pytest
+
+from parameters_validation import validate_parameters, parameter_validation, non_blank
+
+calls = []
+
+
+@parameter_validation
+def counted(param, arg_name):
+    calls.append((arg_name, param))
+
+
+@validate_parameters
+def foo(a: counted(str), b: counted(str) = "b", *, c: counted(str) = "c"):
+    return a, b, c
+
+
+class TestDefaultValuesValidation:
+    @pytest.fixture(autouse=True)
+    def _reset_calls(self):
+        calls.clear()
+
+    def test_defaults_are_not_validated_on_call(self):
+        assert foo("a") == ("a", "b", "c")
+        assert calls == [("a", "a")]
+
+    def test_explicit_values_are_validated(self):
+        foo("a", "x", c="y")
+        assert calls == [("a", "a"), ("b", "x"), ("c", "y")]
+
+    def test_explicit_keyword_values_are_validated(self):
+        foo(a="a", b="x")
+        assert calls == [("a", "a"), ("b", "x")]
+
+    def test_defaults_are_validated_at_definition_time(self):
+        @validate_parameters
+        def bar(a: counted(str) = "a", *, b: counted(str) = "b"):
+            pass
+
+        assert calls == [("a", "a"), ("b", "b")]
+
+    def test_invalid_default_fails_at_definition_time(self):
+        with pytest.raises(ValueError):
+            @validate_parameters
+            def bar(*, a: non_blank(str) = ""):
+                pass
+
+    def test_check_args_skips_defaults(self):
+        assert foo.check_args("a")
+        assert calls == [("a", "a")]
@@ -0,0 +1,181 @@
+import gc
+import json
+import tracemalloc
+
+import pytest
+
+from parameters_validation import failure_log, validate_parameters, non_blank, non_negative, strongly_typed, as_int, \
+    enable_failure_log, disable_failure_log, get_recent_failures, dump_recent_failures, ParametersValidationError
+
+
+@validate_parameters
+def register(name: non_blank(str), age: non_negative(int) = 0):
+    return name, age
+
+
+@validate_parameters
+def paginate(page: non_negative(as_int(str))):
+    return page
+
+
+class TestFailureLog:
+    @pytest.fixture(autouse=True)
+    def _failure_log(self):
+        enable_failure_log(size=5, per_function_size=3)
+        yield
+        disable_failure_log()
+
+    def test_failures_are_recorded(self):
+        with pytest.raises(ValueError):
+            register("John", age=-1)
+
+        failure, = get_recent_failures()
+        assert failure.function == __name__ + ".register"
+        assert failure.parameter == "age"
+        assert failure.validator == "non_negative(int)"
+        assert failure.value == "-1"
+        assert failure.error_type == "ValueError"
+        assert failure.stack is None
+        assert failure.timestamp > 0
+
+    def test_successful_calls_are_not_recorded(self):
+        register("John", 42)
+
+        assert get_recent_failures() == []
+
+    def test_buffers_keep_the_most_recent_failures(self):
+        for age in range(-1, -5, -1):
+            with pytest.raises(ValueError):
+                register("John", age)
+        for page in ("a", "b"):
+            with pytest.raises(ValueError):
+                paginate(page)
+
+        assert [failure.value for failure in register.recent_failures()] == ["-2", "-3", "-4"]
+        assert [failure.value for failure in paginate.recent_failures()] == ["'a'", "'b'"]
+        assert [failure.value for failure in get_recent_failures()] == ["-2", "-3", "-4", "'a'", "'b'"]
+
+    def test_values_are_truncated(self):
+        with pytest.raises(ValueError):
+            register(" " * 1000)
+
+        failure, = get_recent_failures()
+        assert len(failure.value) == 80
+        assert failure.value.endswith("...")
+
+    def test_large_values_are_not_copied(self):
+        value = " " * 10 ** 7
+        tracemalloc.start()
+        try:
+            with pytest.raises(ValueError):
+                register(value)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 10 ** 6
+        failure, = get_recent_failures()
+        assert failure.value == repr(value)[:77] + "..."
+
+    def test_collected_errors_are_recorded_per_parameter(self):
+        @validate_parameters(collect_errors=True)
+        def foo(a: non_blank(str), b: strongly_typed(int)):
+            pass
+
+        with pytest.raises(ParametersValidationError):
+            foo("", "1")
+
+        assert [failure.parameter for failure in foo.recent_failures()] == ["a", "b"]
+
+    def test_sampled_failures_are_recorded(self):
+        @validate_parameters(on_failure="count")
+        def foo(a: non_blank(str)):
+            pass
+
+        foo("")
+
+        assert [failure.parameter for failure in foo.recent_failures()] == ["a"]
+
+    def test_closures_have_separate_buffers(self):
+        def make_validated():
+            @validate_parameters
+            def validated(a: non_blank(str)):
+                pass
+            return validated
+
+        first, second = make_validated(), make_validated()
+        with pytest.raises(ValueError):
+            first("")
+
+        assert len(first.recent_failures()) == 1
+        assert second.recent_failures() == []
+
+    def test_mocked_wrappers_have_separate_buffers(self):
+        mocked = register.mock_validations({"age": non_negative(int)})
+        with pytest.raises(ValueError):
+            mocked("John", -1)
+
+        assert len(mocked.recent_failures()) == 1
+        assert register.recent_failures() == []
+
+    def test_buffers_are_discarded_with_their_function(self):
+        @validate_parameters
+        def foo(a: non_blank(str)):
+            pass
+
+        with pytest.raises(ValueError):
+            foo("")
+        del foo
+        gc.collect()
+
+        assert len(get_recent_failures()) == 1
+        assert len(failure_log._failure_log._function_failures) == 0
+
+    def test_stack_is_recorded(self):
+        enable_failure_log(stack_depth=2)
+
+        with pytest.raises(ValueError):
+            register("")
+
+        failure, = get_recent_failures()
+        assert len(failure.stack) == 2
+        assert "in test_stack_is_recorded" in failure.stack[-1]
+
+    def test_stack_keeps_the_innermost_frames_outermost_first(self):
+        enable_failure_log(stack_depth=2)
+
+        def register_blank():
+            register("")
+
+        with pytest.raises(ValueError):
+            register_blank()
+
+        failure, = get_recent_failures()
+        assert "in test_stack_keeps_the_innermost_frames_outermost_first" in failure.stack[0]
+        assert "in register_blank" in failure.stack[1]
+
+    def test_dump_to_json(self):
+        with pytest.raises(ValueError):
+            paginate("a")
+
+        failure, = json.loads(dump_recent_failures(paginate))
+        assert failure["function"] == __name__ + ".paginate"
+        assert failure["parameter"] == "page"
+        assert failure["value"] == "'a'"
+        assert failure["type"] == "ValueError"
+        assert failure["stack"] is None
+
+    def test_nothing_is_recorded_when_disabled(self):
+        disable_failure_log()
+
+        with pytest.raises(ValueError):
+            register("")
+
+        assert get_recent_failures() == []
+        assert dump_recent_failures() == "[]"
+
+    def test_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            enable_failure_log(size=0)
+        with pytest.raises(ValueError):
+            enable_failure_log(stack_depth=-1)
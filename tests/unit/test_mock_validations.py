@@ -1,6 +1,8 @@
+from unittest.mock import MagicMock, Mock
+
 import pytest
 
-from parameters_validation import validate_parameters, parameter_validation, non_blank
+from parameters_validation import validate_parameters, parameter_validation, non_blank, non_null
 
 
 @parameter_validation
@@ -34,3 +36,18 @@ class TestValidateParametersDecoratorMock:
     def test_unmatched_mock_raises_key_error(self):
         with pytest.raises(KeyError):
             bar.mock_validations({"unmatched": value_error})("non_blank")
+
+    def test_mock_with_another_validation(self):
+        mocked = bar.mock_validations({"arg": non_null(str)})
+        mocked(" ")
+        with pytest.raises(ValueError):
+            mocked(None)
+
+    def test_mock_objects_are_called_with_the_original_value(self):
+        for mock in (Mock(), MagicMock()):
+            @validate_parameters
+            def echo(arg: non_blank(str)):
+                return arg
+
+            assert echo.mock_validations({"arg": mock})("x") == "x"
+            assert echo.mock_validations({"arg": mock})(" ") == " "
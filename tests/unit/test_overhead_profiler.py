@@ -0,0 +1,208 @@
+import pytest
+
+from parameters_validation import validate_parameters, parameter_validation, non_blank, trusted, \
+    overhead_profiler
+from parameters_validation.overhead_profiler import OverheadProfiler, enable_profiling, disable_profiling, \
+    get_profiler
+
+pytest_plugins = "pytester"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, nanoseconds):
+        self.now += nanoseconds
+
+
+clock = FakeClock()
+
+
+@parameter_validation
+def slow(param, arg_name):
+    clock.advance(2000)
+
+
+class TestOverheadProfiler:
+    @pytest.fixture(autouse=True)
+    def _isolated_profiler(self, monkeypatch):
+        monkeypatch.setattr(overhead_profiler, "_profiler", None)
+
+    @pytest.fixture
+    def profiler(self, monkeypatch):
+        profiler = OverheadProfiler(clock=clock)
+        monkeypatch.setattr(overhead_profiler, "_profiler", profiler)
+        return profiler
+
+    def test_validation_overhead_is_separated_from_the_bare_call(self, profiler):
+        @validate_parameters
+        def foo(a: slow(int)):
+            clock.advance(1000)
+            return a
+
+        assert [foo(i) for i in range(3)] == [0, 1, 2]
+
+        result, = profiler.results()
+        assert result.function.endswith("foo")
+        assert result.calls == 3
+        assert result.overhead_per_call == 2000
+        assert result.bare_per_call == 1000
+        assert result.ratio == 2
+
+    def test_rejected_calls_are_counted_apart(self, profiler):
+        @validate_parameters
+        def foo(a: non_blank(str)):
+            clock.advance(1000)
+
+        with pytest.raises(ValueError):
+            foo("")
+        assert profiler.results() == []
+
+        foo("a")
+
+        result, = profiler.results()
+        assert (result.calls, result.rejected) == (1, 1)
+        assert result.bare_per_call == 1000
+        assert result.ratio == 0
+
+    def test_calls_raising_in_the_function_are_measured(self, profiler):
+        @validate_parameters
+        def foo(a: slow(int)):
+            clock.advance(1000)
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            foo(1)
+
+        result, = profiler.results()
+        assert (result.calls, result.rejected) == (1, 0)
+        assert (result.overhead, result.bare) == (2000, 1000)
+
+    def test_validations_calling_profiled_functions_are_not_mistaken_for_the_bare_call(self, profiler):
+        @validate_parameters
+        def inner(a: non_blank(str)):
+            clock.advance(1000)
+
+        @parameter_validation
+        def checked_by_inner(param, arg_name):
+            inner(param)
+            raise ValueError
+
+        @validate_parameters
+        def outer(a: checked_by_inner(str)):
+            pass
+
+        with pytest.raises(ValueError):
+            outer("a")
+
+        results = {result.function.rsplit(".", 1)[-1]: result for result in profiler._results.values()}
+        assert (results["inner"].calls, results["inner"].bare) == (1, 1000)
+        assert (results["outer"].calls, results["outer"].rejected) == (0, 1)
+
+    def test_nested_calls_are_measured_separately(self, profiler):
+        @validate_parameters
+        def inner(a: slow(int)):
+            return a
+
+        @validate_parameters
+        def outer(a: non_blank(str)):
+            return inner(1)
+
+        outer("a")
+
+        results = {result.function.rsplit(".", 1)[-1]: result for result in profiler.results()}
+        assert results["inner"].overhead_per_call == 2000
+        assert results["outer"].overhead_per_call == 0
+        assert results["outer"].bare_per_call == 2000
+
+    def test_trusted_calls_have_no_validation_overhead(self, profiler):
+        @validate_parameters
+        def foo(a: slow(int)):
+            pass
+
+        with trusted():
+            foo(1)
+
+        result, = profiler.results()
+        assert result.overhead_per_call == 0
+
+    def test_calibration_offset_is_subtracted(self):
+        class TickingClock(FakeClock):
+            def __call__(self):
+                self.now += 10
+                return self.now
+
+        profiler = OverheadProfiler(clock=TickingClock())
+        timed = profiler.time_wrapper(len, profiler.time_call(len))
+        timed("")
+
+        result, = profiler.results()
+        assert (result.overhead, result.bare) == (0, 10)
+
+    def test_functions_decorated_before_profiling_are_not_measured(self):
+        @validate_parameters
+        def foo(a: non_blank(str)):
+            pass
+
+        profiler = enable_profiling()
+        try:
+            foo("a")
+            assert profiler.results() == []
+        finally:
+            disable_profiling()
+        assert get_profiler() is None
+
+
+class TestPytestPlugin:
+    @pytest.fixture(autouse=True)
+    def _test_file(self, pytester):
+        pytester.makepyfile("""
+            import time
+            from parameters_validation import validate_parameters, parameter_validation
+
+            @parameter_validation
+            def slow(param, arg_name):
+                time.sleep(0.002)
+
+            @validate_parameters
+            def expensive(a: slow(int)):
+                return a
+
+            def test_expensive():
+                assert expensive(1) == 1
+        """)
+
+    def test_reports_overhead(self, pytester):
+        result = pytester.runpytest("-p", "parameters_validation.pytest_plugin", "--pv-profile")
+
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(["*parameters validation overhead*", "*expensive*1*us*"])
+        assert result.ret == pytest.ExitCode.OK
+
+    def test_fails_when_overhead_budget_is_exceeded(self, pytester):
+        result = pytester.runpytest("-p", "parameters_validation.pytest_plugin", "--pv-profile",
+                                    "--pv-max-overhead=1000")
+
+        result.stdout.fnmatch_lines(["FAILED `*expensive` validation overhead of *us per call exceeds 1000.0us"])
+        assert result.ret == pytest.ExitCode.TESTS_FAILED
+
+    def test_fails_when_ratio_from_ini_is_exceeded(self, pytester):
+        pytester.makeini("""
+            [pytest]
+            pv_max_ratio = 10
+        """)
+        result = pytester.runpytest("-p", "parameters_validation.pytest_plugin", "--pv-profile")
+
+        result.stdout.fnmatch_lines(["FAILED `*expensive` validation overhead is *x its bare call, exceeding 10.0x"])
+        assert result.ret == pytest.ExitCode.TESTS_FAILED
+
+    def test_is_inert_without_profile_option(self, pytester):
+        result = pytester.runpytest("-p", "parameters_validation.pytest_plugin", "--pv-max-overhead=0")
+
+        result.assert_outcomes(passed=1)
+        result.stdout.no_fnmatch_line("*parameters validation overhead*")
+        assert result.ret == pytest.ExitCode.OK
@@ -0,0 +1,66 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from parameters_validation import validate_parameters, parameter_validation, non_blank, \
+    non_null, no_whitespaces, strongly_typed
+
+
+@parameter_validation
+def even(param: int, arg_name: str):
+    if param % 2 != 0:
+        return ValueError("`{n}` must be even".format(n=arg_name))
+
+
+@validate_parameters
+def half(x: even(int)):
+    return x // 2
+
+
+class Methods:
+    @validate_parameters
+    def method(self, s: non_blank(str)):
+        return s
+
+    @staticmethod
+    @validate_parameters
+    def staticmethod(s: non_blank(str)):
+        return s
+
+
+def roundtrip(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+class TestPickling:
+    @pytest.mark.parametrize("validation", [
+        non_blank(str),
+        non_null(),
+        strongly_typed(dict),
+        no_whitespaces(non_blank(str)),
+        non_blank(str) | ~non_null(),
+        even(int) & ~strongly_typed(bool),
+    ])
+    def test_validations_are_restored_as_the_same_instance(self, validation):
+        assert roundtrip(validation) is validation
+
+    def test_validation_factories(self):
+        assert roundtrip(non_blank) is non_blank
+        assert roundtrip(even) is even
+
+    def test_decorated_functions(self):
+        assert roundtrip(half) is half
+        assert roundtrip(Methods.method) is Methods.method
+        assert roundtrip(Methods.staticmethod) is Methods.staticmethod
+
+    def test_validation_results(self):
+        result = roundtrip(non_blank(str).check("", "arg"))
+        assert result.arg_name == "arg"
+        assert isinstance(result.error, ValueError)
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            assert list(executor.map(half, [2, 4, 6])) == [1, 2, 3]
+            with pytest.raises(ValueError):
+                executor.submit(half, 3).result()
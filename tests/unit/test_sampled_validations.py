@@ -0,0 +1,117 @@
+import logging
+
+import pytest
+
+from parameters_validation import validate_parameters, parameter_validation, non_blank, \
+    set_sampling_policy, get_sampling_policy, SamplingPolicy
+
+calls = []
+
+
+@parameter_validation
+def counted(param, arg_name):
+    calls.append(param)
+
+
+class TestSampledValidations:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        calls.clear()
+        yield
+        set_sampling_policy()
+
+    def test_every_nth_call_is_validated(self):
+        @validate_parameters(sample_rate=0.25)
+        def foo(a: counted(int)):
+            return a
+
+        assert [foo(i) for i in range(9)] == list(range(9))
+        assert calls == [0, 4, 8]
+
+    def test_sample_rate_is_respected(self):
+        for sample_rate, expected in ((0.7, 7), (0.4, 4), (0.75, 7.5), (0.3, 3)):
+            calls.clear()
+
+            @validate_parameters(sample_rate=sample_rate)
+            def foo(a: counted(int)):
+                return a
+
+            for i in range(100):
+                foo(i)
+            assert len(calls) == expected * 10
+            assert calls[0] == 0
+
+    def test_sampled_calls_are_evenly_spread(self):
+        @validate_parameters(sample_rate=0.4)
+        def foo(a: counted(int)):
+            return a
+
+        for i in range(10):
+            foo(i)
+        assert calls == [0, 3, 5, 8]
+
+    def test_sampled_failure_raises_by_default(self):
+        @validate_parameters(sample_rate=0.5)
+        def foo(a: non_blank(str)):
+            return a
+
+        with pytest.raises(ValueError):
+            foo("")
+        assert foo("") == ""
+        assert foo.validation_failures() == 1
+
+    def test_sampled_failure_is_logged(self, caplog):
+        @validate_parameters(on_failure="log")
+        def foo(a: non_blank(str)):
+            return a
+
+        with caplog.at_level(logging.WARNING, logger="parameters_validation"):
+            assert foo("") == ""
+        assert "foo" in caplog.text
+        assert foo.validation_failures() == 1
+
+    def test_sampled_failure_is_counted(self):
+        @validate_parameters(sample_rate=1, on_failure="count")
+        def foo(a: non_blank(str)):
+            return a
+
+        foo("")
+        foo("a")
+        foo(" ")
+        assert foo.validation_failures() == 2
+
+    def test_unsampled_functions_report_no_failures(self):
+        @validate_parameters
+        def foo(a: non_blank(str)):
+            return a
+
+        with pytest.raises(ValueError):
+            foo("")
+        assert foo.validation_failures() == 0
+
+    def test_global_policy(self):
+        set_sampling_policy(sample_rate=0.5, on_failure="count")
+
+        @validate_parameters
+        def foo(a: counted(int)):
+            return a
+
+        for i in range(4):
+            foo(i)
+        assert calls == [0, 2]
+        assert get_sampling_policy().on_failure == "count"
+
+    def test_mocked_validations_keep_policy(self):
+        @validate_parameters(sample_rate=0.5)
+        def foo(a: non_blank(str)):
+            return a
+
+        mocked = foo.mock_validations({"a": lambda *_: calls.append("mock")})
+        mocked("")
+        mocked("")
+        assert calls == ["mock"]
+
+    @pytest.mark.parametrize("sample_rate, on_failure", [(0, "raise"), (1.5, "raise"), (1, "ignore")])
+    def test_invalid_policy(self, sample_rate, on_failure):
+        with pytest.raises(ValueError):
+            SamplingPolicy(sample_rate, on_failure)
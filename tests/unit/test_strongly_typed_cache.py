@@ -0,0 +1,120 @@
+from numbers import Number
+from typing import Mapping, Protocol, Sized, runtime_checkable
+
+import pytest
+
+from parameters_validation import validate_parameters, strongly_typed
+from parameters_validation import builtin_validations
+
+
+class LateRegistered:
+    pass
+
+
+@runtime_checkable
+class Closeable(Protocol):
+    def close(self):
+        ...
+
+
+@runtime_checkable
+class Named(Protocol):
+    name: str
+
+
+class WithClose:
+    def close(self):
+        pass
+
+
+class Holder:
+    def __init__(self, closeable):
+        if closeable:
+            self.close = lambda: None
+
+
+class PositiveMeta(type):
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, int) and instance > 0
+
+
+class Positive(metaclass=PositiveMeta):
+    pass
+
+
+class WithName:
+    def __init__(self, name):
+        self.name = name
+
+
+@validate_parameters
+def foo(
+    number: strongly_typed(Number),
+    sized: strongly_typed(Sized),
+    mapping: strongly_typed(Mapping),
+):
+    return number, sized, mapping
+
+
+@validate_parameters
+def closeable(arg: strongly_typed(Closeable)):
+    return arg
+
+
+@validate_parameters
+def named(arg: strongly_typed(Named)):
+    return arg
+
+
+@validate_parameters
+def positive(arg: strongly_typed(Positive)):
+    return arg
+
+
+class TestStronglyTypedCache:
+    def test_alias_decisions_are_cached_per_type(self):
+        foo(1, "", {})
+        assert builtin_validations._type_decisions[Sized, str] is True
+        assert builtin_validations._type_decisions[Mapping, dict] is True
+        with pytest.raises(TypeError):
+            foo(1, "", [])
+        assert builtin_validations._type_decisions[Mapping, list] is False
+
+    def test_protocol_decisions_are_not_cached(self):
+        closeable(WithClose())
+        assert (Closeable, WithClose) not in builtin_validations._type_decisions
+
+    def test_abc_registration_invalidates_cache(self):
+        with pytest.raises(TypeError):
+            foo(1, LateRegistered(), {})
+        Sized.__origin__.register(LateRegistered)
+        foo(1, LateRegistered(), {})
+
+    def test_method_protocol(self):
+        closeable(WithClose())
+        with pytest.raises(TypeError):
+            closeable(object())
+
+    def test_method_protocol_is_checked_per_instance(self):
+        closeable(Holder(True))
+        with pytest.raises(TypeError):
+            closeable(Holder(False))
+        closeable(Holder(True))
+
+    def test_custom_metaclass_is_checked_per_instance(self):
+        positive(5)
+        with pytest.raises(TypeError):
+            positive(-1)
+
+    def test_data_protocol_is_checked_per_instance(self):
+        named(WithName("name"))
+        instance = WithName("name")
+        del instance.name
+        with pytest.raises(TypeError):
+            named(instance)
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(builtin_validations, "_TYPE_DECISIONS_MAX_SIZE", 2)
+        for value in ("", [], (), {}):
+            foo(1, value, {})
+        assert len(builtin_validations._type_decisions) <= 2
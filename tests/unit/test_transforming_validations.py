@@ -0,0 +1,142 @@
+import pickle
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from parameters_validation import validate_parameters, parameter_validation, as_int, \
+    as_uuid, as_datetime, non_negative, non_null, non_blank, trusted, \
+    ParametersValidationError
+
+UUID_STRING = "6f1d3b1c-5f5e-4a8e-9d2a-0c0b9c2d7e4f"
+
+parsed = []
+
+
+@parameter_validation(transform=True)
+def counted_int(param, arg_name):
+    parsed.append(param)
+    return int(param)
+
+
+@validate_parameters
+def foo(page: non_negative(as_int(str)), key: as_uuid(str), *, day: as_datetime("%Y-%m-%d")(str) = "2019-06-01"):
+    return page, key, day
+
+
+@validate_parameters
+def bar(raw: str, value: counted_int(str)):
+    return raw, value
+
+
+@validate_parameters
+def optional_int(value: as_int(str) | ~non_null() = None):
+    return value
+
+
+class TestTransformingValidations:
+    @pytest.fixture(autouse=True)
+    def _reset_parsed(self):
+        parsed.clear()
+
+    def test_values_are_converted(self):
+        assert foo("41", UUID_STRING, day="2020-01-31") == (41, UUID(UUID_STRING), datetime(2020, 1, 31))
+        assert foo(page="41", key=UUID_STRING)[0] == 41
+
+    def test_defaults_are_converted_once(self):
+        assert foo("1", UUID_STRING)[2] == datetime(2019, 6, 1)
+
+    def test_values_are_parsed_once(self):
+        assert bar("raw", "7") == ("raw", 7)
+        assert parsed == ["7"]
+
+    def test_failures(self):
+        with pytest.raises(ValueError):
+            foo("x", UUID_STRING)
+        with pytest.raises(ValueError):
+            foo("-1", UUID_STRING)
+        with pytest.raises(ValueError):
+            foo("1", "not-an-uuid")
+        with pytest.raises(ValueError):
+            foo("1", UUID_STRING, day="01/06/2019")
+
+    def test_raising_transformation(self):
+        with pytest.raises(ValueError):
+            bar("raw", "x")
+
+    def test_alternatives(self):
+        assert optional_int("3") == 3
+        assert optional_int(None) is None
+        assert optional_int() is None
+        with pytest.raises(ValueError):
+            optional_int("x")
+
+    def test_check(self):
+        result = as_int(str).check("3", "arg")
+        assert result and result.value == 3
+        assert not as_int(str).check("x", "arg")
+        assert (as_int(str) | ~non_null()).check("4", "arg").value == 4
+
+    def test_call_returns_converted_value(self):
+        assert non_negative(as_int(str))("5", "arg") == 5
+        assert non_blank(str)("a", "arg") == "a"
+
+    def test_collect_errors(self):
+        @validate_parameters(collect_errors=True)
+        def baz(a: as_int(str), b: as_int(str)):
+            return a + b
+
+        assert baz("1", "2") == 3
+        with pytest.raises(ParametersValidationError) as e:
+            baz("x", "y")
+        assert e.value.parameters == ("a", "b")
+
+    def test_unsampled_calls_are_converted(self):
+        @validate_parameters(sample_rate=0.5)
+        def inc(x: as_int(str) = "0"):
+            return x + 1
+
+        assert [inc("1"), inc("1"), inc(), inc()] == [2, 2, 1, 1]
+
+    def test_trusted_calls_are_converted(self):
+        with trusted():
+            assert bar("raw", "7") == ("raw", 7)
+            assert foo("1", UUID_STRING)[2] == datetime(2019, 6, 1)
+        assert parsed == ["7"]
+
+    def test_trusted_calls_skip_other_validations(self):
+        @validate_parameters
+        def baz(a: as_int(str), b: non_blank(str)):
+            return a, b
+
+        with trusted():
+            assert baz("1", "") == (1, "")
+
+    def test_skipped_validations_still_convert(self):
+        assert foo.skip_validations()("1", UUID_STRING) == (1, UUID(UUID_STRING), datetime(2019, 6, 1))
+        assert bar.skip_validations()("raw", "7") == ("raw", 7)
+
+    def test_logged_failures_still_convert(self):
+        @validate_parameters(on_failure="log")
+        def baz(a: as_int(str), b: non_blank(str)):
+            return a, b
+
+        assert baz("1", "") == (1, "")
+        assert baz("x", "") == ("x", "")
+        assert baz.validation_failures() == 2
+
+    def test_counted_failures_are_parsed_once(self):
+        @validate_parameters(on_failure="count")
+        def baz(a: counted_int(str), b: counted_int(str)):
+            return a, b
+
+        assert baz("x", "2") == ("x", 2)
+        assert parsed == ["x", "2"]
+        assert baz.validation_failures() == 1
+
+    def test_as_datetime_is_shared_per_format(self):
+        assert as_datetime("%Y")(str) is as_datetime("%Y")(str)
+
+    def test_pickling(self):
+        for validation in (as_int(str), as_uuid(str), as_datetime("%Y-%m-%d")(str)):
+            assert pickle.loads(pickle.dumps(validation)) is validation
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+
+import pytest
+
+from parameters_validation import validate_parameters, non_blank, trusted, is_trusted
+
+
+@validate_parameters
+def foo(arg: non_blank(str)):
+    return arg
+
+
+@trusted()
+def trusted_layer(arg):
+    return foo(arg)
+
+
+@trusted()
+async def trusted_coroutine(arg):
+    await asyncio.sleep(0)
+    return foo(arg)
+
+
+class TestTrustedContext:
+    def test_setup(self):
+        with pytest.raises(ValueError):
+            foo("")
+
+    def test_context_manager_bypasses_validations(self):
+        with trusted():
+            assert foo("") == ""
+        with pytest.raises(ValueError):
+            foo("")
+
+    def test_nested_contexts(self):
+        with trusted():
+            with trusted():
+                assert is_trusted()
+            assert is_trusted()
+        assert not is_trusted()
+
+    def test_decorator_bypasses_validations(self):
+        assert trusted_layer("") == ""
+        with pytest.raises(ValueError):
+            foo("")
+
+    def test_coroutine_decorator_bypasses_validations(self):
+        assert asyncio.run(trusted_coroutine("")) == ""
+        assert not is_trusted()
+
+    def test_trusted_state_is_not_shared_across_threads(self):
+        errors = []
+
+        def untrusted_call():
+            try:
+                foo("")
+            except ValueError as e:
+                errors.append(e)
+
+        with trusted():
+            thread = threading.Thread(target=untrusted_call)
+            thread.start()
+            thread.join()
+        assert len(errors) == 1
+
+    def test_trusted_state_is_not_shared_across_tasks(self):
+        async def untrusted_call():
+            await asyncio.sleep(0)
+            with pytest.raises(ValueError):
+                foo("")
+
+        async def trusted_call():
+            with trusted():
+                await asyncio.sleep(0)
+                return foo("")
+
+        async def main():
+            return await asyncio.gather(trusted_call(), untrusted_call())
+
+        assert asyncio.run(main())[0] == ""
+
+    def test_shared_instance_across_tasks(self):
+        shared = trusted()
+
+        async def trusted_call(delay):
+            with shared:
+                await asyncio.sleep(delay)
+                result = foo("")
+            assert not is_trusted()
+            return result
+
+        async def main():
+            return await asyncio.gather(trusted_call(0), trusted_call(0.01))
+
+        assert asyncio.run(main()) == ["", ""]
+        assert not is_trusted()
+
+    def test_shared_instance_across_threads(self):
+        shared = trusted()
+        entered = threading.Barrier(2)
+        results = []
+
+        def trusted_call():
+            with shared:
+                entered.wait()
+                results.append(foo(""))
+            results.append(is_trusted())
+
+        threads = [threading.Thread(target=trusted_call) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(results, key=str) == ["", "", False, False]
@@ -0,0 +1,266 @@
+import inspect
+from dataclasses import dataclass, field, FrozenInstanceError, InitVar
+from typing import ClassVar
+
+import pytest
+
+from parameters_validation import validate_fields, parameter_validation, non_blank, non_negative, \
+    non_empty, non_null, as_int
+
+
+@validate_fields
+@dataclass
+class User:
+    name: non_blank(str)
+    age: non_negative(int) = 0
+    nickname: str = ""
+    tags: non_empty(list) = field(default_factory=lambda: ["user"])
+
+
+@validate_fields
+@dataclass(slots=True, frozen=True)
+class FrozenUser:
+    name: non_blank(str)
+    age: non_negative(int) = 0
+
+
+@validate_fields
+@dataclass(kw_only=True)
+class KeywordOnlyUser:
+    name: non_blank(str)
+    age: non_negative(int) = 0
+
+
+@validate_fields(validate_assignment=True)
+@dataclass
+class MutableUser:
+    name: non_blank(str)
+    age: non_negative(int) = 0
+
+
+@validate_fields
+class Point:
+    dimensions: ClassVar[int] = 2
+    x: non_negative(int)
+    y: non_negative(int) = 0
+
+
+@validate_fields(validate_assignment=True)
+class SlottedPoint:
+    __slots__ = ("x", "y")
+    x: non_negative(int)
+    y: non_negative(int)
+
+
+@validate_fields
+class Handwritten:
+    name: non_null(str)
+
+    def __init__(self, name, *args, **kwargs):
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+
+
+class TestValidateFieldsDataclass:
+    def test_success(self):
+        user = User("John", 42)
+        assert (user.name, user.age, user.nickname, user.tags) == ("John", 42, "", ["user"])
+        assert User(name="Joe", tags=["admin"]).tags == ["admin"]
+
+    def test_failure(self):
+        with pytest.raises(ValueError):
+            User(" ")
+        with pytest.raises(ValueError):
+            User("John", -1)
+        with pytest.raises(ValueError):
+            User("John", tags=[])
+
+    def test_missing_argument(self):
+        with pytest.raises(TypeError):
+            User()
+
+    def test_default_factory_values_are_validated(self):
+        @validate_fields
+        @dataclass
+        class Bad:
+            tags: non_empty(list) = field(default_factory=list)
+
+        with pytest.raises(ValueError):
+            Bad()
+
+    def test_invalid_default_fails_at_definition_time(self):
+        with pytest.raises(ValueError):
+            @validate_fields
+            @dataclass
+            class Bad:
+                age: non_negative(int) = -1
+
+    def test_slots_frozen_dataclass(self):
+        user = FrozenUser("John")
+        assert (user.name, user.age) == ("John", 0)
+        with pytest.raises(ValueError):
+            FrozenUser("John", -1)
+        with pytest.raises(FrozenInstanceError):
+            user.age = 1
+
+    def test_keyword_only_dataclass(self):
+        assert KeywordOnlyUser(name="John").name == "John"
+        with pytest.raises(ValueError):
+            KeywordOnlyUser(name="")
+
+    def test_validate_assignment(self):
+        user = MutableUser("John")
+        user.age = 1
+        with pytest.raises(ValueError):
+            user.age = -1
+        with pytest.raises(ValueError):
+            MutableUser("")
+        assert user.age == 1
+
+    def test_validate_assignment_validates_defaults_once(self):
+        checked = []
+
+        @parameter_validation
+        def recorded(param, arg_name):
+            checked.append(param)
+
+        @validate_fields(validate_assignment=True)
+        @dataclass
+        class Counter:
+            start: recorded(int) = 0
+
+        checked.clear()
+        Counter()
+        Counter()
+        assert checked == []
+        Counter(1)
+        assert checked == [1]
+
+    def test_validate_assignment_keeps_dataclass_init_semantics(self):
+        @validate_fields(validate_assignment=True)
+        @dataclass
+        class Order:
+            quantity: non_negative(int)
+            scale: InitVar[int] = 1
+            tags: non_empty(list) = field(default_factory=lambda: ["new"])
+            total: int = field(init=False, default=0)
+            history: list = field(init=False, default_factory=list)
+
+            def __post_init__(self, scale):
+                self.total = self.quantity * scale
+
+        order = Order(2, 3)
+        assert (order.quantity, order.tags, order.total, order.history) == (2, ["new"], 6, [])
+        assert Order(1).tags is not order.tags
+        with pytest.raises(ValueError):
+            Order(-1)
+        with pytest.raises(ValueError):
+            Order(1, tags=[])
+
+    def test_generated_init_signature(self):
+        for cls in (User, MutableUser):
+            assert inspect.signature(cls.__init__).parameters["age"].default == 0
+
+
+class TestValidateFieldsPlainClass:
+    def test_generated_init(self):
+        point = Point(1)
+        assert (point.x, point.y) == (1, 0)
+        assert Point(x=1, y=2).y == 2
+        assert "dimensions" not in vars(point)
+
+    def test_failure(self):
+        with pytest.raises(ValueError):
+            Point(-1)
+        with pytest.raises(ValueError):
+            Point(1, -1)
+
+    def test_slotted_class_with_validate_assignment(self):
+        point = SlottedPoint(1, 2)
+        point.x = 3
+        with pytest.raises(ValueError):
+            point.y = -1
+        with pytest.raises(ValueError):
+            SlottedPoint(-1, 2)
+        assert (point.x, point.y) == (3, 2)
+
+    def test_handwritten_init_is_delegated_to(self):
+        instance = Handwritten("name", 1, key="value")
+        assert (instance.name, instance.args, instance.kwargs) == ("name", (1,), {"key": "value"})
+        with pytest.raises(ValueError):
+            Handwritten(None)
+
+    def test_generated_init_signature(self):
+        assert str(inspect.signature(Point.__init__)) == "(self, x, y=0)"
+
+    def test_inherited_init_is_delegated_to(self):
+        class Base:
+            def __init__(self, a):
+                self.a = a
+                self.double = a * 2
+
+        @validate_fields
+        class Child(Base):
+            a: non_negative(int)
+
+        child = Child(1)
+        assert (child.a, child.double) == (1, 2)
+        with pytest.raises(ValueError):
+            Child(-1)
+
+    def test_inherited_generated_init_is_regenerated(self):
+        @validate_fields
+        class Child(Point):
+            z: non_negative(int) = 0
+
+        child = Child(1, 2, 3)
+        assert (child.x, child.y, child.z) == (1, 2, 3)
+        with pytest.raises(ValueError):
+            Child(1, 2, -3)
+
+    def test_fields_without_default_after_defaults_are_rejected(self):
+        with pytest.raises(TypeError):
+            @validate_fields
+            class Bad:
+                a: non_null(str) = ""
+                b: non_null(str)
+
+
+class TestValidateFieldsTransforms:
+    def test_plain_class_fields_are_converted(self):
+        @validate_fields(validate_assignment=True)
+        class Page:
+            number: non_negative(as_int(str))
+            size: as_int(str) = "10"
+
+        page = Page("1")
+        assert (page.number, page.size) == (1, 10)
+        page.number = "2"
+        assert page.number == 2
+        with pytest.raises(ValueError):
+            page.number = "-1"
+
+    def test_dataclass_fields_are_converted(self):
+        @validate_fields
+        @dataclass(frozen=True)
+        class Page:
+            number: as_int(str)
+            size: as_int(str) = "10"
+            offset: as_int(str) = field(default_factory=lambda: "0")
+
+        page = Page("1")
+        assert (page.number, page.size, page.offset) == (1, 10, 0)
+        page = Page("1", size="20", offset="5")
+        assert (page.size, page.offset) == (20, 5)
+
+    def test_dataclass_assignment_is_converted(self):
+        @validate_fields(validate_assignment=True)
+        @dataclass
+        class Page:
+            number: as_int(str)
+
+        page = Page("1")
+        assert page.number == 1
+        page.number = "3"
+        assert page.number == 3
@@ -0,0 +1,43 @@
+import copy
+
+import pytest
+
+from parameters_validation import non_null, non_blank, no_whitespaces
+
+
+class TestValidationInterning:
+    def test_identical_validations_are_shared(self):
+        assert non_null(str) is non_null(str)
+        assert no_whitespaces(non_blank(str)) is no_whitespaces(non_blank(str))
+        assert (non_blank(str) | ~non_null()) is (non_blank(str) | ~non_null())
+
+    def test_different_validations_are_not_shared(self):
+        assert non_null(str) is not non_null(int)
+        assert non_null(str) is not non_blank(str)
+        assert no_whitespaces(non_blank(str)) is not non_blank(no_whitespaces(str))
+
+    def test_equal_arguments_of_different_types_are_not_shared(self):
+        validations = [non_null(1), non_null(1.0), non_null(True)]
+        assert [type(validation._arg_type) for validation in validations] == [int, float, bool]
+        assert (non_null(1) | non_null(True))._expression[2][2] is True
+
+    def test_unhashable_arg_type(self):
+        unhashable = [str]
+        assert non_null(unhashable) is not non_null(unhashable)
+
+    def test_validations_have_no_instance_dict(self):
+        assert not hasattr(non_null(str), "__dict__")
+
+    def test_validations_are_immutable(self):
+        validation = non_null(str)
+        with pytest.raises(AttributeError):
+            validation._arg_type = int
+        with pytest.raises(AttributeError):
+            del validation._arg_type
+        with pytest.raises(AttributeError):
+            validation.anything = None
+
+    def test_copies_are_the_same_validation(self):
+        validation = non_null(str)
+        assert copy.copy(validation) is validation
+        assert copy.deepcopy(validation) is validation
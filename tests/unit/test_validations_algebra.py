@@ -0,0 +1,109 @@
+import pytest
+
+from parameters_validation import validate_parameters, parameter_validation, \
+    non_blank, non_null, non_empty, no_whitespaces, non_negative, strongly_typed
+
+calls = []
+
+
+@parameter_validation
+def raising_odd(param: int, arg_name: str):
+    calls.append(param)
+    if param % 2 != 0:
+        raise ValueError("`{n}` is odd".format(n=arg_name))
+
+
+@validate_parameters
+def optional_name(name: non_blank(str) | ~non_null()):
+    return name
+
+
+@validate_parameters
+def tag(value: non_empty(str) & no_whitespaces(str)):
+    return value
+
+
+@validate_parameters
+def even_or_negative(value: raising_odd(int) | ~non_negative(int)):
+    return value
+
+
+@validate_parameters
+def nested_alternative(value: non_empty(strongly_typed(str) | strongly_typed(list))):
+    return value
+
+
+class TestValidationsAlgebra:
+    @pytest.fixture(autouse=True)
+    def _reset_calls(self):
+        calls.clear()
+
+    def test_or(self):
+        assert optional_name("name") == "name"
+        assert optional_name(None) is None
+        with pytest.raises(ValueError):
+            optional_name(" ")
+
+    def test_and(self):
+        assert tag("tag") == "tag"
+        with pytest.raises(ValueError):
+            tag("")
+        with pytest.raises(ValueError):
+            tag("a tag")
+
+    def test_not(self):
+        validation = ~strongly_typed(str)
+        assert validation.check(1, "arg")
+        result = validation.check("", "arg")
+        assert isinstance(result.error, ValueError)
+        assert "strongly_typed(str)" in str(result.error)
+
+    def test_failed_or_describes_every_alternative(self):
+        with pytest.raises(ValueError, match=r"must satisfy `\(non_blank\(str\) \| ~non_null\(\)\)`"):
+            optional_name(" ")
+
+    def test_failed_or_keeps_type_errors(self):
+        with pytest.raises(TypeError, match=r"must satisfy `\(strongly_typed\(str\) \| strongly_typed\(list\)\)`"):
+            (strongly_typed(str) | strongly_typed(list))(1, "arg")
+
+    def test_failed_not_describes_whole_operand(self):
+        validation = ~(strongly_typed(str) & non_blank(str))
+        with pytest.raises(ValueError, match=r"must not satisfy `\(strongly_typed\(str\) & non_blank\(str\)\)`"):
+            validation("name", "arg")
+
+    def test_failed_and_keeps_own_error(self):
+        with pytest.raises(ValueError, match="whitespaces"):
+            tag("a tag")
+
+    def test_or_short_circuits(self):
+        assert even_or_negative(2) == 2
+        assert calls == [2]
+
+    def test_or_catches_raised_errors_of_failed_branches(self):
+        assert even_or_negative(-3) == -3
+        with pytest.raises(ValueError):
+            even_or_negative(3)
+
+    def test_nested_composition(self):
+        assert nested_alternative("name") == "name"
+        assert nested_alternative([None]) == [None]
+        with pytest.raises(TypeError):
+            nested_alternative(1)
+        with pytest.raises(ValueError):
+            nested_alternative([])
+
+    def test_check(self):
+        assert (non_blank(str) | ~non_null()).check(None, "arg")
+        assert not (non_blank(str) | ~non_null()).check("", "arg")
+
+    def test_plan_is_flat(self):
+        validation = (non_blank(str) | ~non_null()) & no_whitespaces(str)
+        assert len(validation._plan) == 3
+        assert all(len(instruction) == 6 for instruction in validation._plan)
+
+    def test_repr(self):
+        assert repr(non_blank(str) | ~non_null()) == "(non_blank(str) | ~non_null())"
+
+    def test_cannot_combine_with_other_objects(self):
+        with pytest.raises(TypeError):
+            non_blank(str) | str